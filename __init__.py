@@ -3,10 +3,10 @@
 import importlib
 import sys
 
-from . import api_client, helpers, operators, panels, props
+from . import api_client, batch, blobs, cache, connection, events, helpers, jobs, metrics, operators, panels, props, push, scanner, search, selector_cache, session, store, thumbnails
 
 # Module reload support for Blender development
-_modules = [api_client, helpers, props, operators, panels]
+_modules = [metrics, api_client, cache, jobs, connection, events, store, search, push, batch, blobs, thumbnails, scanner, helpers, selector_cache, session, props, operators, panels]
 
 def _reload_modules():
     for mod in _modules:
@@ -21,13 +21,25 @@ def register():
     props.register()
     operators.register()
     panels.register()
+    scanner.register()
+    blobs.register()
+    connection.register()
+    session.register()
 
 
 def unregister():
     """Unregister all Clustta classes and properties from Blender."""
+    session.unregister()
+    connection.unregister()
+    scanner.unregister()
+    blobs.unregister()
+    events.unregister()
+    thumbnails.unregister()
     panels.unregister()
     operators.unregister()
     props.unregister()
+    jobs.shutdown()
+    api_client.close_client()
 
 
 if __name__ == "__main__":
@@ -1,49 +1,459 @@
 """HTTP client for communicating with the Clustta Bridge on localhost."""
 
+import gzip
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Any
+import select
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterator
+from urllib.parse import quote, urlsplit
+
+from . import metrics
+
+try:
+    import msgpack
+except ImportError:
+    # Not bundled with Blender; responses are then negotiated as JSON
+    msgpack = None
 
 BRIDGE_HOST = "http://127.0.0.1"
 BRIDGE_PORT = 1173
+REQUEST_TIMEOUT = 3
+MAX_IDLE_CONNECTIONS = 8
+ASSET_PAGE_SIZE = 2000
+CHECKPOINT_PAGE_SIZE = 50
+MAX_VALIDATED_RESPONSES = 256
+# Consecutive unreachable-bridge failures after which requests fail immediately
+FAILURE_THRESHOLD = 3
+# Bounds of the per-endpoint timeouts derived from observed latency (seconds)
+MIN_TIMEOUT = 1.5
+MAX_TIMEOUT = 30.0
+# Timeout for downloading checkpoint contents, which can be large (seconds)
+DOWNLOAD_TIMEOUT = 120.0
+
+BRIDGE_UNREACHABLE = "Check if Clustta is running"
+# A non-idempotent request lost on a stale connection is not retried; the bridge may have applied it
+REQUEST_INTERRUPTED = "Connection to Clustta was lost; check whether the change was applied"
+# A slow answer means the bridge is up but busy; it does not count towards the circuit
+BRIDGE_TIMEOUT = "Clustta did not answer in time"
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+# Bridges that know msgpack answer with it; others ignore the preference and send JSON
+ACCEPT_BINARY = "application/msgpack, application/json;q=0.9, */*;q=0.8"
+ACCEPT_JSON = "application/json, */*;q=0.8"
 
 _instance = None
 
+# Errors raised when a kept-alive socket was closed by the other side,
+# typically because the bridge restarted between two requests.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+# Methods safe to send again when a stale connection fails after the request went out
+_IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+
+def decode_body(content_type: str, content: bytes) -> Any:
+    """Decode a response body by its media type: msgpack if negotiated, otherwise JSON."""
+    media = content_type.split(";", 1)[0].strip().lower()
+    if not content:
+        return None
+    if media in MSGPACK_TYPES:
+        if msgpack is None:
+            raise ValueError(f"Cannot decode {media} without msgpack")
+        return msgpack.unpackb(content, raw=False)
+    return json.loads(content)
+
+
+def _is_stale(conn: http.client.HTTPConnection) -> bool:
+    """Return True if the bridge closed or reset an idle connection."""
+    if conn.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    # No response is pending on an idle connection, so anything to read is EOF or an error
+    return bool(readable)
+
+
+def _set_timeout(conn: http.client.HTTPConnection, timeout: float) -> None:
+    """Change the timeout of a connection, whether or not it is connected yet."""
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+
+class _ConnectionPool:
+    """Thread-safe pool of persistent HTTP/1.1 connections to the bridge."""
+
+    def __init__(self, host: str, port: int, timeout: float = REQUEST_TIMEOUT, max_idle: int = MAX_IDLE_CONNECTIONS):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None, fresh: bool = False) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection, or a new one if fresh or none is left. The flag is True if it was reused.
+
+        Idle connections the bridge has closed are dropped rather than reused.
+        A timeout overrides the pool default until the connection is released.
+        """
+        conn, reused = None, False
+        while not fresh:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not _is_stale(conn):
+                reused = True
+                break
+            conn.close()
+            conn = None
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        if timeout is not None:
+            _set_timeout(conn, timeout)
+        return conn, reused
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        """Hand a healthy connection back to the pool for reuse."""
+        if conn.timeout != self.timeout:
+            _set_timeout(conn, self.timeout)
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class _Flight:
+    """A GET in progress; identical requests wait for its result instead of repeating it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: tuple[Any, str | None] = (None, None)
+
+
+class _CircuitBreaker:
+    """Tracks whether the bridge is reachable.
+
+    Opens after FAILURE_THRESHOLD consecutive transport failures; while open,
+    requests fail without touching the network. Any successful exchange, such
+    as a health probe, closes it again.
+    """
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD):
+        self.threshold = threshold
+        self.failures = 0
+        self.is_open = False
+        self._lock = threading.Lock()
+
+    def record(self, reachable: bool) -> None:
+        with self._lock:
+            if reachable:
+                self.failures = 0
+                self.is_open = False
+            else:
+                self.failures += 1
+                if self.failures >= self.threshold:
+                    self.is_open = True
+
+
+class _AdaptiveTimeouts:
+    """Per-endpoint timeouts from a smoothed latency and its deviation, as TCP computes retransmit timeouts."""
+
+    def __init__(self):
+        # endpoint -> (smoothed latency, latency deviation)
+        self._estimates: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def timeout_for(self, endpoint: str) -> float:
+        with self._lock:
+            estimate = self._estimates.get(endpoint)
+        if estimate is None:
+            return REQUEST_TIMEOUT
+        smoothed, deviation = estimate
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, smoothed + 4 * deviation))
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Fold in the latency of a successful request."""
+        with self._lock:
+            estimate = self._estimates.get(endpoint)
+            if estimate is None:
+                self._estimates[endpoint] = (seconds, seconds / 2)
+                return
+            smoothed, deviation = estimate
+            deviation = 0.75 * deviation + 0.25 * abs(smoothed - seconds)
+            smoothed = 0.875 * smoothed + 0.125 * seconds
+            self._estimates[endpoint] = (smoothed, deviation)
+
+    def back_off(self, endpoint: str, timeout: float) -> None:
+        """Widen an endpoint's timeout after a request timed out."""
+        with self._lock:
+            self._estimates[endpoint] = (min(MAX_TIMEOUT, 2 * timeout), 0.0)
+
 
 class BridgeClient:
     """Simple HTTP client wrapping the Clustta Bridge REST API."""
 
-    def __init__(self, host: str = BRIDGE_HOST, port: int = BRIDGE_PORT):
+    def __init__(self, host: str = BRIDGE_HOST, port: int = BRIDGE_PORT, binary: bool = True):
         self.base_url = f"{host}:{port}"
+        # Responses are asked for as msgpack, which decodes faster than JSON, when it is installed
+        self._accept = ACCEPT_BINARY if binary and msgpack is not None else ACCEPT_JSON
+        self._pool = _ConnectionPool(urlsplit(host).hostname or "127.0.0.1", port)
+        self._session_supported = True
+        # Advanced around every account, studio or project switch. Most GETs answer
+        # for the bridge's active selections, so responses are only shared or
+        # revalidated between requests made in the same epoch.
+        self._epoch = 0
+        # (epoch, path) -> (etag, last_modified, data) of conditional GETs, most recently used last
+        self._validated: OrderedDict[tuple[int, str], tuple[str | None, str | None, Any]] = OrderedDict()
+        self._validated_lock = threading.Lock()
+        # (epoch, path) -> GET currently in flight
+        self._inflight: dict[tuple[int, str], _Flight] = {}
+        self._inflight_lock = threading.Lock()
+        self._breaker = _CircuitBreaker()
+        self._timeouts = _AdaptiveTimeouts()
+
+    def close(self) -> None:
+        """Release all pooled connections."""
+        self._pool.close()
 
-    def _request(self, method: str, path: str, body: dict | None = None) -> tuple[Any, str | None]:
-        """Make an HTTP request to the bridge. Returns (data, error)."""
-        url = f"{self.base_url}{path}"
-        headers = {"Content-Type": "application/json"}
+    def is_available(self) -> bool:
+        """Return False while the circuit is open, i.e. the bridge failed repeatedly."""
+        return not self._breaker.is_open
 
-        data = json.dumps(body).encode("utf-8") if body else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    def _request(self, method: str, path: str, body: dict | bytes | memoryview | None = None, conditional: bool = False, timeout: float | None = None) -> tuple[Any, str | None]:
+        """Make an HTTP request to the bridge. Returns (data, error).
+
+        Dict bodies are sent as JSON, bytes-like bodies as raw octets;
+        application/octet-stream and image responses are returned as bytes,
+        others are decoded as msgpack or JSON, whichever the bridge chose. With
+        conditional, the GET carries the validators of the last response for
+        the path; a 304 returns that response's already-parsed data object.
+        timeout overrides the endpoint's adaptive timeout, e.g. for long polls.
+        Latency, bytes, errors and timeouts are recorded per endpoint.
+
+        A GET for a path that is already being fetched on another thread in the
+        same scope epoch waits for that request and returns the same (shared,
+        read-only) result. While the bridge is considered down, requests fail
+        immediately.
+        """
+        if self._breaker.is_open:
+            metrics.record_rejected(method, path)
+            return None, BRIDGE_UNREACHABLE
+        if method != "GET":
+            return self._timed_request(method, path, body, conditional, timeout)
+
+        with self._inflight_lock:
+            key = (self._epoch, path)
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        if not leader:
+            metrics.record_coalesced(method, path)
+            flight.done.wait()
+            return flight.result
 
         try:
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                content = resp.read().decode("utf-8")
-                return json.loads(content) if content else None, None
-        except urllib.error.HTTPError as e:
-            return None, f"HTTP {e.code}: {e.reason}"
-        except urllib.error.URLError:
-            return None, "Check if Clustta is running"
-        except (TimeoutError, OSError):
-            return None, "Check if Clustta is running"
+            flight.result = self._timed_request(method, path, body, conditional, timeout, key)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.done.set()
+        return flight.result
+
+    @property
+    def epoch(self) -> int:
+        """Return a number that changes with every account, studio or project switch."""
+        return self._epoch
+
+    def _switch(self, path: str, body: dict) -> tuple[Any, str | None]:
+        """POST a switch of the active account, studio or project, starting a new scope epoch.
+
+        The epoch advances before and after the request, so GETs made while the
+        bridge may be answering for either selection are never reused.
+        """
+        with self._inflight_lock:
+            self._epoch += 1
+        try:
+            return self._request("POST", path, body)
+        finally:
+            with self._inflight_lock:
+                self._epoch += 1
+
+    def _timed_request(self, method: str, path: str, body: dict | bytes | memoryview | None, conditional: bool, timeout: float | None, key: tuple[int, str] | None = None) -> tuple[Any, str | None]:
+        """Perform a request, record its metrics and update the connection health."""
+        endpoint = metrics.endpoint_name(method, path)
+        adaptive = timeout is None
+        if adaptive:
+            timeout = self._timeouts.timeout_for(endpoint)
+
+        exchange = {"sent": 0, "received": 0, "timed_out": False, "unreachable": False}
+        start = time.perf_counter()
+        result, err = self._send(method, path, body, conditional and key is not None, timeout, exchange, key)
+        elapsed = time.perf_counter() - start
+
+        unreachable = exchange.pop("unreachable")
+        if not exchange["timed_out"]:
+            self._breaker.record(not unreachable)
+        if adaptive:
+            if exchange["timed_out"]:
+                self._timeouts.back_off(endpoint, timeout)
+            elif not unreachable:
+                self._timeouts.observe(endpoint, elapsed)
+        metrics.record_request(method, path, elapsed, error=err, **exchange)
+        return result, err
+
+    def _send(self, method: str, path: str, body: dict | bytes | memoryview | None, conditional: bool, timeout: float | None, exchange: dict, key: tuple[int, str] | None) -> tuple[Any, str | None]:
+        """Perform a request for _request, noting traffic and timeouts in exchange.
+
+        Validators of conditional GETs are kept under key, the request's (epoch, path).
+        """
+        headers = {"Content-Type": "application/json", "Accept": self._accept, "Accept-Encoding": "gzip"}
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            headers["Content-Type"] = "application/octet-stream"
+            data = body
+        else:
+            data = json.dumps(body).encode("utf-8") if body else None
+
+        cached = None
+        if conditional:
+            with self._validated_lock:
+                cached = self._validated.get(key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+        # A pooled connection may have gone stale if the bridge restarted or
+        # closed it while idle; retry once on a new connection before reporting
+        # the bridge as down. A POST or PUT the bridge may already have acted on
+        # is not sent twice.
+        fresh = False
+        for _ in range(2):
+            conn, reused = self._pool.acquire(timeout, fresh)
+            sent = False
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                sent = True
+                exchange["sent"] += len(data) if data else 0
+                resp = conn.getresponse()
+                content = resp.read()
+                exchange["received"] += len(content)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    # The other idle connections have most likely gone stale with it
+                    self._pool.close()
+                    fresh = True
+                    continue
+                if reused:
+                    return None, REQUEST_INTERRUPTED
+                exchange["unreachable"] = True
+                return None, BRIDGE_UNREACHABLE
+            except TimeoutError:
+                conn.close()
+                exchange["timed_out"] = True
+                return None, BRIDGE_TIMEOUT
+            except OSError:
+                conn.close()
+                exchange["unreachable"] = True
+                return None, BRIDGE_UNREACHABLE
+            except Exception as e:
+                conn.close()
+                return None, str(e)
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._pool.release(conn)
+            break
+        else:
+            exchange["unreachable"] = True
+            return None, BRIDGE_UNREACHABLE
+
+        if resp.status == 304 and cached is not None:
+            with self._validated_lock:
+                self._validated.move_to_end(key)
+            return cached[2], None
+
+        if resp.status >= 400:
+            return None, f"HTTP {resp.status}: {resp.reason}"
+
+        try:
+            if resp.getheader("Content-Encoding", "").lower() == "gzip":
+                content = gzip.decompress(content)
+            content_type = resp.getheader("Content-Type", "")
+            if content_type.startswith(("application/octet-stream", "image/")):
+                return content, None
+            result = decode_body(content_type, content)
         except Exception as e:
             return None, str(e)
 
+        if conditional:
+            self._remember(key, resp.getheader("ETag"), resp.getheader("Last-Modified"), result)
+        return result, None
+
+    def _remember(self, key: tuple[int, str], etag: str | None, last_modified: str | None, data: Any) -> None:
+        """Keep a response and its validators for later conditional requests."""
+        with self._validated_lock:
+            if not etag and not last_modified:
+                self._validated.pop(key, None)
+                return
+            self._validated[key] = (etag, last_modified, data)
+            self._validated.move_to_end(key)
+            while len(self._validated) > MAX_VALIDATED_RESPONSES:
+                self._validated.popitem(last=False)
+
     # Health
     def health_check(self) -> tuple[bool, str | None]:
-        """Check if the bridge is reachable."""
-        data, err = self._request("GET", "/health")
+        """Check if the bridge is reachable. Always goes to the network; success closes the circuit."""
+        data, err = self._timed_request("GET", "/health", None, False, None)
         return err is None, err
 
+    # Session
+    def get_session(self) -> tuple[dict | None, str | None]:
+        """Get accounts, studios, projects and the active selections in one round trip.
+
+        Older bridges without the endpoint answer 404; the client then stops asking.
+        """
+        if not self._session_supported:
+            return None, "Session snapshot not supported by bridge"
+        data, err = self._request("GET", "/session")
+        if err and err.startswith("HTTP 404"):
+            self._session_supported = False
+        return data, err
+
+    # Events
+    def poll_events(self, cursor: str, wait: float) -> tuple[dict | None, str | None]:
+        """Long-poll for changes in the active project after cursor.
+
+        The bridge answers as soon as there are events, or after wait seconds with
+        none, as {"cursor": str, "events": [...]} (plus "resync": true if the
+        cursor is too old to replay). An empty cursor returns the current one.
+        """
+        return self._request("GET", f"/events?cursor={quote(cursor, safe='')}&wait={int(wait)}", timeout=wait + REQUEST_TIMEOUT)
+
     # Accounts
     def list_accounts(self) -> tuple[list | None, str | None]:
         """List accounts stored in the OS keyring."""
@@ -51,7 +461,7 @@ class BridgeClient:
 
     def switch_account(self, account_id: str) -> tuple[Any, str | None]:
         """Set the active account."""
-        return self._request("POST", "/accounts/switch", {"id": account_id})
+        return self._switch("/accounts/switch", {"id": account_id})
 
     def get_active_account(self) -> tuple[dict | None, str | None]:
         """Get the currently active account."""
@@ -64,20 +474,22 @@ class BridgeClient:
 
     def switch_studio(self, studio_name: str) -> tuple[Any, str | None]:
         """Set the active studio by name."""
-        return self._request("POST", "/studios/switch", {"name": studio_name})
+        return self._switch("/studios/switch", {"name": studio_name})
 
     def get_active_studio(self) -> tuple[dict | None, str | None]:
         """Get the currently active studio."""
         return self._request("GET", "/studios/active")
 
     # Projects
-    def list_projects(self) -> tuple[list | None, str | None]:
-        """List projects in the active studio."""
+    def list_projects(self, studio_name: str | None = None) -> tuple[list | None, str | None]:
+        """List projects in the active studio, or in another studio of the active account by name."""
+        if studio_name:
+            return self._request("GET", f"/studios/{quote(studio_name, safe='')}/projects")
         return self._request("GET", "/projects")
 
     def switch_project(self, project_uri: str) -> tuple[Any, str | None]:
         """Set the active project by URI."""
-        return self._request("POST", "/projects/switch", {"uri": project_uri})
+        return self._switch("/projects/switch", {"uri": project_uri})
 
     def get_active_project(self) -> tuple[dict | None, str | None]:
         """Get the currently active project."""
@@ -86,18 +498,96 @@ class BridgeClient:
     def get_assets(self, ext: str = ".blend") -> tuple[list | None, str | None]:
         """Get assets for the active project, filtered by extension."""
         params = f"?ext={ext}" if ext else ""
-        return self._request("GET", f"/assets{params}")
+        return self._request("GET", f"/assets{params}", conditional=True)
+
+    def iter_asset_pages(self, ext: str = ".blend", page_size: int = ASSET_PAGE_SIZE, project_id: str | None = None) -> Iterator[tuple[list | None, str | None]]:
+        """Yield assets for the active project, or another project by URI, one page at a time as (assets, error).
+
+        Paging bridges answer {"assets": [...], "next_offset": n}; older bridges
+        ignore offset/limit and return a plain list, which is yielded as one page.
+        A page of the active project the bridge reports as unchanged (304) is
+        yielded as the same list object as last time, so callers can skip it by
+        identity. Pages of other projects are not kept for revalidation.
+        """
+        base = f"/projects/{quote(project_id, safe='')}/assets" if project_id else "/assets"
+        offset = 0
+        while True:
+            params = f"?ext={ext}&" if ext else "?"
+            data, err = self._request("GET", f"{base}{params}offset={offset}&limit={page_size}", conditional=project_id is None)
+            if err:
+                yield None, err
+                return
+            if not isinstance(data, dict):
+                yield data or [], None
+                return
+
+            page = data.get("assets") or []
+            yield page, None
+            next_offset = data.get("next_offset")
+            if not page or next_offset is None:
+                return
+            offset = next_offset
 
     def get_checkpoints(self, asset_id: str) -> tuple[list | None, str | None]:
         """Get checkpoint history for an asset in the active project."""
-        return self._request("GET", f"/assets/{asset_id}/checkpoints")
+        return self._request("GET", f"/assets/{asset_id}/checkpoints", conditional=True)
+
+    def get_checkpoint_page(self, asset_id: str, offset: int = 0, limit: int = CHECKPOINT_PAGE_SIZE) -> tuple[tuple[list, int | None] | None, str | None]:
+        """Get one page of an asset's checkpoint history as ((checkpoints, next_offset), error).
+
+        Bridges without paging return the whole history, reported with next_offset None.
+        """
+        data, err = self._request("GET", f"/assets/{asset_id}/checkpoints?offset={offset}&limit={limit}", conditional=True)
+        if err:
+            return None, err
+        if isinstance(data, dict):
+            return (data.get("checkpoints") or [], data.get("next_offset")), None
+        return (data or [], None), None
+
+    def create_checkpoint(self, project_id: str, asset_id: str, message: str, file_path: str, chunks: list[dict] | None = None) -> tuple[Any, str | None]:
+        """Create a checkpoint and trigger sync push.
 
-    def create_checkpoint(self, project_id: str, asset_id: str, message: str, file_path: str) -> tuple[Any, str | None]:
-        """Create a checkpoint and trigger sync push."""
-        return self._request("POST", f"/projects/{project_id}/assets/{asset_id}/checkpoints", {
+        With chunks (a manifest of {"hash", "size"} in file order, all already
+        held by the bridge), the bridge assembles the checkpoint from them
+        instead of reading the file.
+        """
+        body = {
             "message": message,
             "filePath": file_path,
-        })
+        }
+        if chunks is not None:
+            body["chunks"] = chunks
+        return self._request("POST", f"/projects/{quote(project_id, safe='')}/assets/{asset_id}/checkpoints", body)
+
+    def find_missing_chunks(self, project_id: str, hashes: list[str]) -> tuple[list | None, str | None]:
+        """Return which of the chunk hashes the bridge does not hold yet."""
+        data, err = self._request("POST", f"/projects/{quote(project_id, safe='')}/chunks/missing", {"hashes": hashes})
+        if err:
+            return None, err
+        return (data or {}).get("missing", []), None
+
+    def upload_chunk(self, project_id: str, digest: str, data: bytes | memoryview) -> tuple[Any, str | None]:
+        """Upload the raw bytes of one chunk, addressed by its SHA-256."""
+        return self._request("PUT", f"/projects/{quote(project_id, safe='')}/chunks/{digest}", data)
+
+    def get_thumbnail(self, project_id: str, asset_id: str) -> tuple[bytes | None, str | None]:
+        """Get an asset's thumbnail as encoded image bytes."""
+        return self._request("GET", f"/projects/{quote(project_id, safe='')}/assets/{asset_id}/thumbnail")
+
+    def get_checkpoint_chunks(self, project_id: str, asset_id: str, checkpoint_id: str) -> tuple[list | None, str | None]:
+        """Return the chunk manifest of a checkpoint's file: [{"hash", "size"}] in file order."""
+        data, err = self._request("GET", f"/projects/{quote(project_id, safe='')}/assets/{asset_id}/checkpoints/{checkpoint_id}/chunks")
+        if err:
+            return None, err
+        return (data or {}).get("chunks", []), None
+
+    def download_chunk(self, project_id: str, digest: str) -> tuple[bytes | None, str | None]:
+        """Download the raw bytes of one chunk, addressed by its SHA-256."""
+        return self._request("GET", f"/projects/{quote(project_id, safe='')}/chunks/{digest}", timeout=DOWNLOAD_TIMEOUT)
+
+    def download_checkpoint(self, project_id: str, asset_id: str, checkpoint_id: str) -> tuple[bytes | None, str | None]:
+        """Download a checkpoint's whole file, for bridges without chunk endpoints."""
+        return self._request("GET", f"/projects/{quote(project_id, safe='')}/assets/{asset_id}/checkpoints/{checkpoint_id}/file", timeout=DOWNLOAD_TIMEOUT)
 
 
 def get_client() -> BridgeClient:
@@ -106,3 +596,11 @@ def get_client() -> BridgeClient:
     if _instance is None:
         _instance = BridgeClient()
     return _instance
+
+
+def close_client() -> None:
+    """Close the singleton client's pooled connections, if it exists."""
+    global _instance
+    if _instance is not None:
+        _instance.close()
+        _instance = None
@@ -0,0 +1,105 @@
+"""Batch checkpoints: checkpoint many assets with one message through a bounded queue.
+
+Assets are pushed as single checkpoints are (see push.py), at most
+BATCH_WORKERS at a time, so the bridge and the disk are not flooded and the
+shared request pool stays free for the UI. One asset failing does not stop
+the others; failures are collected per asset.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import jobs, push
+
+BATCH_WORKERS = 4
+
+_progress = None
+
+
+class BatchProgress:
+    """Progress of a batch, written by the workers and read by the UI."""
+
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.running = {}
+        self.succeeded = []
+        self.failed = {}
+        self.skipped = 0
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def fraction(self):
+        return self.done / self.total if self.total else 0.0
+
+    def _start(self, asset_id, progress):
+        with self._lock:
+            self.running[asset_id] = progress
+
+    def _skip(self):
+        with self._lock:
+            self.skipped += 1
+            self.done += 1
+
+    def _finish(self, asset_id, err):
+        with self._lock:
+            self.running.pop(asset_id, None)
+            if err:
+                self.failed[asset_id] = err
+            else:
+                self.succeeded.append(asset_id)
+            self.done += 1
+
+
+def _push_one(project_id, asset_id, message, file_path, progress):
+    """Worker: push one asset's checkpoint unless the batch was cancelled."""
+    if progress.cancelled:
+        progress._skip()
+        return
+    if not os.path.isfile(file_path):
+        progress._finish(asset_id, f"File not found: {file_path}")
+        return
+    item = push.PushProgress(asset_id)
+    progress._start(asset_id, item)
+    try:
+        _, err = push.push_checkpoint(project_id, asset_id, message, file_path, item)
+    except Exception as e:
+        # Recorded per asset, so the batch still finishes and reports it
+        err = str(e) or type(e).__name__
+    progress._finish(asset_id, err)
+
+
+def _run(project_id, assets, message, progress):
+    """Worker: push every (asset_id, file_path), BATCH_WORKERS at a time."""
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="clustta-batch") as pool:
+        for asset_id, file_path in assets:
+            pool.submit(_push_one, project_id, asset_id, message, file_path, progress)
+    return progress
+
+
+def start(project_id, assets, message, on_done=None):
+    """Checkpoint a list of (asset_id, file_path) in the background. Returns False if a batch is already running."""
+    global _progress
+    if is_running():
+        return False
+    progress = BatchProgress(len(assets))
+    _progress = progress
+    return jobs.submit(("batch",), _run, project_id, list(assets), message, progress, on_done=on_done)
+
+
+def cancel():
+    """Skip the assets of the running batch that have not started yet."""
+    if _progress is not None:
+        _progress.cancelled = True
+
+
+def is_running():
+    """Return True while a batch is in progress."""
+    return jobs.is_pending(("batch",))
+
+
+def current_progress():
+    """Return the progress of the running or last batch, or None."""
+    return _progress
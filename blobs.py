@@ -0,0 +1,343 @@
+"""Content-addressed local cache of checkpoint files, for restoring and opening older versions.
+
+The bridge keeps checkpoint files as chunks addressed by their SHA-256 (see
+push.py). Downloaded chunks are stored on disk under their hash, so a
+checkpoint is fetched from the bridge once, and versions of a file share the
+chunks they have in common. Toggling between recent versions only reads
+local disk. Least recently used chunks and copies written to be opened on
+their own are evicted beyond BLOB_CACHE_MAX_BYTES, except chunks of
+checkpoints being fetched or written, files still being written, and the
+copy Blender has loaded or is about to load.
+
+Assets whose checkpoints were opened or restored before are treated as
+commonly opened: their newest checkpoints are prefetched in the background
+when their history is shown.
+"""
+
+import contextlib
+import hashlib
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+from bpy.app.handlers import persistent
+
+from . import api_client, cache, jobs, push
+
+BLOB_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DOWNLOAD_WORKERS = 4
+# Newest checkpoints of a commonly opened asset to keep local
+PREFETCH_CHECKPOINTS = 2
+# Temporary files younger than this may still be being written (seconds)
+TMP_GRACE_PERIOD = 3600
+
+_lock = threading.Lock()
+# digest -> number of fetches using the chunk; pinned chunks are never evicted
+_pins = Counter()
+_progress = None
+_opens = None
+# The file Blender has loaded and the copy last written to be opened; never evicted
+_loaded_file = ""
+_written_file = ""
+
+
+def blob_dir():
+    """Return the directory holding cached chunks, creating it if needed."""
+    path = os.path.join(cache.cache_dir(), "blobs")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _blob_path(digest):
+    return os.path.join(blob_dir(), digest[:2], digest)
+
+
+def _opened_dir():
+    return os.path.join(blob_dir(), "opened")
+
+
+def opened_path(checkpoint_id, file_name):
+    """Return where a checkpoint is written to be opened on its own."""
+    return os.path.join(_opened_dir(), checkpoint_id, file_name)
+
+
+@contextlib.contextmanager
+def _pinned(chunks):
+    """Keep the chunks of a manifest from being evicted while the block runs."""
+    digests = {c["hash"] for c in chunks}
+    with _lock:
+        _pins.update(digests)
+    try:
+        yield
+    finally:
+        with _lock:
+            _pins.subtract(digests)
+            for digest in digests:
+                if _pins[digest] <= 0:
+                    del _pins[digest]
+
+
+def _has_blob(digest):
+    """Return True if a chunk is cached, marking it recently used."""
+    try:
+        os.utime(_blob_path(digest))
+        return True
+    except OSError:
+        return False
+
+
+def _write_blob(digest, data):
+    """Store a chunk under its hash. Returns an error if the data does not match the hash or cannot be written."""
+    if hashlib.sha256(data).hexdigest() != digest:
+        return f"Chunk {digest[:12]} is corrupt"
+    path = _blob_path(digest)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # e.g. a full disk
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        return str(e)
+    return None
+
+
+def _manifest(client, project_id, asset_id, checkpoint_id, progress):
+    """Return the chunk manifest of a checkpoint, from the disk cache or the bridge. Returns (chunks, error)."""
+    chunks = cache.load("manifest", project_id, checkpoint_id)
+    if chunks is not None:
+        return chunks, None
+
+    chunks, err = client.get_checkpoint_chunks(project_id, asset_id, checkpoint_id)
+    if err and err.startswith("HTTP 404"):
+        # Bridge without chunk endpoints: cache the whole file as one chunk
+        progress.start_phase("Downloading", 1)
+        data, err = client.download_checkpoint(project_id, asset_id, checkpoint_id)
+        if err:
+            return None, err
+        digest = hashlib.sha256(data).hexdigest()
+        err = _write_blob(digest, data)
+        if err:
+            return None, err
+        progress.done = 1
+        chunks = [{"hash": digest, "size": len(data)}]
+    elif err:
+        return None, err
+    cache.store("manifest", project_id, checkpoint_id, data=chunks)
+    return chunks, None
+
+
+def _download_missing(client, project_id, chunks, progress):
+    """Worker: download the chunks of a manifest that are not cached. Returns the first error or None."""
+    missing = list({c["hash"]: c["size"] for c in chunks if not _has_blob(c["hash"])}.items())
+    progress.chunks = len(chunks)
+    progress.start_phase("Downloading", sum(size for _, size in missing))
+
+    def download(digest, size):
+        try:
+            data, err = client.download_chunk(project_id, digest)
+            if not err:
+                err = _write_blob(digest, data)
+        except Exception as e:
+            err = str(e) or type(e).__name__
+        progress.done += size
+        progress.uploaded += 1
+        return err
+
+    if not missing:
+        return None
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="clustta-download") as pool:
+        errors = [e for e in pool.map(lambda m: download(*m), missing) if e]
+    return errors[0] if errors else None
+
+
+def fetch(project_id, asset_id, checkpoint_id, progress=None):
+    """Worker: make every chunk of a checkpoint local. Returns (chunks, error)."""
+    progress = progress or push.PushProgress(asset_id)
+    client = api_client.get_client()
+    chunks, err = _manifest(client, project_id, asset_id, checkpoint_id, progress)
+    if err:
+        return None, err
+    with _pinned(chunks):
+        err = _download_missing(client, project_id, chunks, progress)
+        _evict(BLOB_CACHE_MAX_BYTES)
+    if err:
+        return None, err
+    return chunks, None
+
+
+def materialize(project_id, asset_id, checkpoint_id, dest, progress=None):
+    """Worker: write a checkpoint's file to dest, downloading only chunks not cached. Returns (dest, error).
+
+    The checkpoint's chunks stay pinned until the file is written, so even a
+    checkpoint larger than the cache limit is never evicted half way.
+    """
+    global _written_file
+    progress = progress or push.PushProgress(asset_id)
+    client = api_client.get_client()
+    chunks, err = _manifest(client, project_id, asset_id, checkpoint_id, progress)
+    if err:
+        return None, err
+
+    tmp_path = f"{dest}.clustta.tmp"
+    with _pinned(chunks):
+        err = _download_missing(client, project_id, chunks, progress)
+        if err:
+            return None, err
+        progress.start_phase("Writing", sum(c["size"] for c in chunks))
+        try:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            with open(tmp_path, "wb") as out:
+                for c in chunks:
+                    with open(_blob_path(c["hash"]), "rb") as f:
+                        shutil.copyfileobj(f, out)
+                    progress.done += c["size"]
+            with _lock:
+                os.replace(tmp_path, dest)
+                _written_file = dest
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return None, str(e)
+    _evict(BLOB_CACHE_MAX_BYTES)
+    return dest, None
+
+
+def _evict(max_bytes):
+    """Delete least recently used chunks and opened copies until the cache fits in max_bytes.
+
+    Pinned chunks are neither counted nor deleted. The loaded and last written
+    copies, and temporary files younger than TMP_GRACE_PERIOD, count towards
+    max_bytes but are kept.
+    """
+    with _lock:
+        kept = {os.path.normcase(p) for p in (_loaded_file, _written_file) if p}
+        writing_since = time.time() - TMP_GRACE_PERIOD
+        entries = []
+        total = 0
+        for root, _, files in os.walk(blob_dir()):
+            for name in files:
+                if name in _pins:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                total += st.st_size
+                if os.path.normcase(path) in kept or (name.endswith(".tmp") and st.st_mtime > writing_since):
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        if total <= max_bytes:
+            return
+        entries.sort()
+        opened_dir = _opened_dir()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                # e.g. an opened copy another Blender still has open on Windows
+                continue
+            if os.path.dirname(os.path.dirname(path)) == opened_dir:
+                # Drop the checkpoint's directory once its copy is gone
+                with contextlib.suppress(OSError):
+                    os.rmdir(os.path.dirname(path))
+            total -= size
+            if total <= max_bytes:
+                break
+
+
+def clear():
+    """Delete every cached chunk and opened copy that is not in use."""
+    _evict(0)
+
+
+def _open_counts():
+    """Cache writer: return the per-asset open counts, reading them from disk on first use."""
+    global _opens
+    if _opens is None:
+        _opens = cache.load("checkpoint-opens") or {}
+    return _opens
+
+
+def _note_open(asset_id):
+    """Cache writer: count an open of an asset's checkpoint and save the counts."""
+    counts = _open_counts()
+    counts[asset_id] = counts.get(asset_id, 0) + 1
+    cache.store("checkpoint-opens", data=dict(counts))
+
+
+def start(project_id, asset_id, checkpoint_id, dest, on_done=None):
+    """Write a checkpoint's file to dest in the background. Returns False if one is already being written."""
+    global _progress
+    if is_running():
+        return False
+    cache.defer(_note_open, asset_id)
+
+    progress = push.PushProgress(asset_id)
+    _progress = progress
+
+    def finished(result):
+        _, err = result
+        progress.error = err
+        progress.phase = "Failed" if err else "Done"
+        if on_done is not None:
+            on_done(result)
+
+    def run():
+        # Any failure must come back as the error, or the modal would load a file that was never written
+        try:
+            return materialize(project_id, asset_id, checkpoint_id, dest, progress)
+        except Exception as e:
+            return None, str(e) or type(e).__name__
+
+    return jobs.submit(("checkpoint-file",), run, on_done=finished)
+
+
+def is_running():
+    """Return True while a checkpoint file is being written."""
+    return jobs.is_pending(("checkpoint-file",))
+
+
+def current_progress():
+    """Return the progress of the running or last checkpoint file, or None."""
+    return _progress
+
+
+def prefetch(project_id, asset_id, checkpoints):
+    """Download the newest checkpoints of a commonly opened asset in the background."""
+    if _opens is None:
+        # Read on the cache writer; prefetching starts once the counts are known
+        cache.defer(_open_counts)
+        return
+    if not _opens.get(asset_id):
+        return
+    for cp in checkpoints[:PREFETCH_CHECKPOINTS]:
+        checkpoint_id = cp.get("id", "")
+        if checkpoint_id:
+            jobs.submit(("blob-prefetch", checkpoint_id), fetch, project_id, asset_id, checkpoint_id)
+
+
+@persistent
+def _on_load_post(*args):
+    """Remember which file Blender has loaded, so its opened copy is never evicted."""
+    global _loaded_file
+    _loaded_file = bpy.data.filepath
+
+
+def register():
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
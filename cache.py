@@ -0,0 +1,210 @@
+"""Caches of bridge responses: a persistent on-disk cache keyed per account, studio
+and project, and a bounded in-memory LRU cache."""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+import bpy
+
+# Total size of cached files before the least recently used ones are evicted
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_cache_dir = None
+_lock = threading.Lock()
+# Disk work handed off by the main thread, run in order on one writer thread
+_deferred = queue.Queue()
+_writer = None
+
+
+def cache_dir():
+    """Return the addon's cache directory, creating it if needed."""
+    global _cache_dir
+    if _cache_dir is None:
+        try:
+            base = bpy.utils.extension_path_user(__package__, path="cache", create=True)
+        except (ValueError, AttributeError):
+            # Installed as a legacy addon rather than an extension
+            base = bpy.utils.user_resource("CACHE", path="clustta", create=True)
+        _cache_dir = base
+    return _cache_dir
+
+
+def _entry_path(kind, key):
+    """Return the file path of a cache entry."""
+    digest = hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir(), f"{kind}-{digest}.json")
+
+
+def load(kind, *key):
+    """Return cached data for a key, or None on a miss. Safe to call from worker threads."""
+    path = _entry_path(kind, key)
+    try:
+        with open(path, "rb") as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if entry.get("key") != list(key):
+        return None
+
+    # Bump the modification time so eviction treats the entry as recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry.get("data")
+
+
+def store(kind, *key, data):
+    """Write data for a key, then evict old entries beyond the size limit. Safe to call from worker threads."""
+    path = _entry_path(kind, key)
+    payload = json.dumps({"key": list(key), "saved_at": time.time(), "data": data}).encode("utf-8")
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    _evict(CACHE_MAX_BYTES)
+
+
+def defer(fn, *args):
+    """Run fn(*args) on the cache's writer thread, after every call deferred before it.
+
+    Lets the main thread write or read-modify-write entries without touching
+    the disk; the result is discarded.
+    """
+    global _writer
+    if _writer is None or not _writer.is_alive():
+        _writer = threading.Thread(target=_write_deferred, name="clustta-cache-writer", daemon=True)
+        _writer.start()
+    _deferred.put((fn, args))
+
+
+def store_later(kind, *key, data):
+    """Like store(), but written on the writer thread. Later writes of a key win."""
+    defer(lambda: store(kind, *key, data=data))
+
+
+def _write_deferred():
+    while True:
+        fn, args = _deferred.get()
+        try:
+            fn(*args)
+        except Exception:
+            traceback.print_exc()
+
+
+def _evict(max_bytes):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    with _lock:
+        entries = []
+        total = 0
+        try:
+            with os.scandir(cache_dir()) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError:
+            return
+
+        if total <= max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
+
+
+def clear():
+    """Delete every cache entry."""
+    _evict(0)
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with an optional time-to-live and hit/miss counters."""
+
+    def __init__(self, max_entries, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key):
+        """Return the (stored_at, value) entry for key if present and not expired. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            return None
+        return entry
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it recently used, counting a hit or a miss."""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def peek(self, key, default=None):
+        """Return the value for key without counting or reordering."""
+        with self._lock:
+            entry = self._live(key)
+            return default if entry is None else entry[1]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond the limit."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._live(key) is not None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return entry count and hit/miss counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,94 @@
+"""Connection health: keeps bridge_connected in step with the bridge and reconnects on its own.
+
+Once the user has connected, and while the bridge is then unreachable,
+/health is probed in the background with exponential backoff; the first
+successful probe closes the client's circuit and reloads the selector state,
+just as the Connect button does. Nothing is probed before the first
+connection.
+"""
+
+import random
+import time
+
+import bpy
+
+from . import api_client, jobs
+
+CHECK_INTERVAL = 0.5
+PROBE_BASE_DELAY = 1.0
+PROBE_MAX_DELAY = 30.0
+
+_failures = 0
+_next_probe = 0.0
+# Set by the first successful connection; until then the bridge is left alone
+_auto_reconnect = False
+
+
+def mark_connected():
+    """Note a successful connection, so a later loss of the bridge is reconnected automatically."""
+    global _auto_reconnect, _failures, _next_probe
+    _auto_reconnect = True
+    _failures = 0
+    _next_probe = 0.0
+
+
+def _probe_delay(failures):
+    """Return the wait before the next probe, doubling per failure with some jitter."""
+    delay = min(PROBE_MAX_DELAY, PROBE_BASE_DELAY * 2 ** min(failures, 16))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _on_probe(result):
+    """Main thread: mark the bridge connected after a successful probe, or schedule the next one."""
+    global _failures, _next_probe
+    ok, _ = result
+    if not ok:
+        _failures += 1
+        _next_probe = time.monotonic() + _probe_delay(_failures)
+        return
+
+    _failures = 0
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None or scene.clustta.bridge_connected:
+        return
+    from . import helpers, session, thumbnails
+    clustta = scene.clustta
+    clustta.bridge_connected = True
+    session.revalidate()
+    # Thumbnails the bridge could not serve while it was down
+    thumbnails.forget_missing()
+    if helpers.last_asset_load()[1]:
+        # The last load failed while the bridge was down; let the panel load again
+        helpers.reset_asset_cache()
+    jobs.tag_redraw()
+
+
+def _tick():
+    """Timer callback: reflect the circuit state in the UI and probe the bridge while it is down."""
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return CHECK_INTERVAL
+    clustta = scene.clustta
+    client = api_client.get_client()
+
+    if clustta.bridge_connected and not client.is_available():
+        clustta.bridge_connected = False
+        jobs.tag_redraw()
+
+    if _auto_reconnect and not clustta.bridge_connected and time.monotonic() >= _next_probe:
+        jobs.submit(("health-probe",), client.health_check, on_done=_on_probe)
+    return CHECK_INTERVAL
+
+
+def register():
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=CHECK_INTERVAL, persistent=True)
+
+
+def unregister():
+    global _failures, _next_probe, _auto_reconnect
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    _failures = 0
+    _next_probe = 0.0
+    _auto_reconnect = False
@@ -0,0 +1,98 @@
+"""Change subscription: long-polls the bridge for per-asset deltas of the active project.
+
+One request is outstanding at a time. The bridge holds it open until
+something changes, so an idle studio costs one cheap request per POLL_WAIT
+seconds per seat instead of repeated full list downloads.
+"""
+
+import bpy
+
+from . import api_client, jobs
+
+# Seconds the bridge may hold a poll open before answering with no events
+POLL_WAIT = 25
+# Delays between retries after failed polls, the last one repeating
+RETRY_DELAYS = (1, 2, 5, 10, 30)
+
+_project_id = ""
+_cursor = ""
+_failures = 0
+_supported = True
+
+
+def subscribe(project_id):
+    """Follow changes of a project, replacing any previous subscription."""
+    global _project_id, _cursor, _failures
+    if not _supported or not project_id:
+        return
+    if project_id == _project_id:
+        return
+    _project_id = project_id
+    _cursor = ""
+    _failures = 0
+    _poll()
+
+
+def unsubscribe():
+    """Stop following changes. A poll in flight is ignored when it returns."""
+    global _project_id, _cursor
+    _project_id = ""
+    _cursor = ""
+    if bpy.app.timers.is_registered(_retry):
+        bpy.app.timers.unregister(_retry)
+
+
+def _poll():
+    project_id, cursor = _project_id, _cursor
+    jobs.submit(
+        ("events", project_id),
+        api_client.get_client().poll_events, cursor, POLL_WAIT,
+        on_done=lambda result: _on_events(project_id, result),
+    )
+
+
+def _retry():
+    """Timer callback: poll again after a failure."""
+    if _project_id:
+        _poll()
+    return None
+
+
+def _on_events(project_id, result):
+    """Apply a poll result on the main thread and start the next poll."""
+    global _cursor, _failures, _supported
+    if project_id != _project_id:
+        return
+
+    data, err = result
+    if err and err.startswith("HTTP 404"):
+        # Bridge without an event feed: the refresh buttons remain the way to update
+        _supported = False
+        unsubscribe()
+        return
+    if err or not isinstance(data, dict):
+        delay = RETRY_DELAYS[min(_failures, len(RETRY_DELAYS) - 1)]
+        _failures += 1
+        if not bpy.app.timers.is_registered(_retry):
+            bpy.app.timers.register(_retry, first_interval=delay)
+        return
+
+    _failures = 0
+    from . import helpers
+    scene = getattr(bpy.context, "scene", None)
+    clustta = scene.clustta if scene is not None else None
+    if clustta is not None and clustta.active_project_id == project_id:
+        if data.get("resync"):
+            # Too far behind to replay the deltas: reload, revalidating page by page
+            helpers.request_assets(clustta, use_cache=False)
+        elif _cursor:
+            helpers.apply_events(clustta, data.get("events") or [])
+
+    _cursor = data.get("cursor") or _cursor
+    _poll()
+
+
+def unregister():
+    global _supported
+    unsubscribe()
+    _supported = True
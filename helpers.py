@@ -1,11 +1,48 @@
 """Shared helper functions for loading data from the Clustta Bridge."""
 
+import queue
+import time
+from collections import deque
 from datetime import datetime
 
-from . import api_client
+import bpy
+
+from . import api_client, blobs, cache, events, jobs, metrics, scanner, search, store, thumbnails
 
 _loaded_assets_project_id = ""
 _loaded_checkpoint_asset_id = ""
+_checkpoint_next_offset = None
+_asset_ingest = None
+# Source of truth for the loaded assets; clustta.assets only holds the visible window
+asset_store = store.AssetStore()
+# (store version, type filter, status filter, query) and the rows of the last filter pass
+_filtered = (None, [])
+_offpage_active_id = ""
+# Asset ids ticked in the list for batch actions; kept across pages and filters
+_selected_ids = set()
+_last_asset_load = (0, None)
+# (project_id, pages) of the live bridge pages the asset store currently mirrors
+_shown_asset_pages = ("", [])
+# Change events that arrived while an asset load was streaming in
+_deferred_events = []
+
+# Main-thread time spent applying streamed asset rows per timer tick (seconds)
+INGEST_BUDGET = 0.008
+INGEST_INTERVAL = 0.01
+INGEST_BATCH = 64
+
+# Rows shown in the asset list at a time
+ASSET_WINDOW_SIZE = 200
+
+CHECKPOINT_PAGE_SIZE = 50
+# Checkpoint lists kept in memory: asset_id -> (checkpoints loaded so far, next_offset)
+MAX_CACHED_CHECKPOINT_LISTS = 64
+CHECKPOINT_CACHE_TTL = 300
+
+_checkpoint_cache = cache.LRUCache(MAX_CACHED_CHECKPOINT_LISTS, ttl=CHECKPOINT_CACHE_TTL)
+
+# Marks the end of cached rows in an asset stream; live rows from the bridge follow
+_END_OF_CACHE = object()
 
 # File state icon mapping (Blender built-in icons)
 FILE_STATE_ICONS = {
@@ -17,6 +54,15 @@ FILE_STATE_ICONS = {
 }
 FILE_STATE_DEFAULT_ICON = "RADIOBUT_OFF"
 
+# ClusttaAssetItem attribute -> bridge asset field
+ASSET_FIELDS = (
+    ("name", "name"),
+    ("file_path", "file_path"),
+    ("asset_type", "task_type_name"),
+    ("status", "status_short_name"),
+    ("file_state", "file_status"),
+)
+
 
 def _format_timestamp(iso_str):
     """Convert an ISO 8601 timestamp to a short human-readable format (e.g. '4 Jan 26')."""
@@ -29,81 +75,723 @@ def _format_timestamp(iso_str):
         return iso_str
 
 
-def load_assets(clustta):
-    """Fetch assets from bridge and populate the collection."""
+def _active_clustta():
+    """Return the Clustta properties of the current scene, or None outside a window context."""
+    scene = getattr(bpy.context, "scene", None)
+    return scene.clustta if scene is not None else None
+
+
+def _write_window_item(item, row):
+    """Write changed fields of a store row onto a list item."""
+    asset_id = asset_store.ids[row]
+    if item.asset_id != asset_id:
+        item.asset_id = asset_id
+    for attr, key in ASSET_FIELDS:
+        value = asset_store.get(row, key)
+        if getattr(item, attr) != value:
+            setattr(item, attr, value)
+
+
+class _AssetIngest:
+    """Incremental, keyed reconcile of the asset store from a stream of bridge rows.
+
+    Rows are queued by a worker thread and applied on the main thread in
+    time-sliced batches. While streaming, rows are only updated in place or
+    appended; removals and reordering happen in finish().
+    """
+
+    def __init__(self, project_id="", scope=None, previous_pages=None):
+        self.project_id = project_id
+        self.scope = scope
+        self.previous_pages = previous_pages or []
+        self.live_pages = []
+        self.unchanged = False
+        self.pages = queue.Queue()
+        self.rows = deque()
+        self.fetched = False
+        self.cancelled = False
+        self.error = None
+        self.order = []
+        self.seen = set()
+        self.changed = 0
+
+    def feed(self, page):
+        """Queue a page of bridge assets. Safe to call from a worker thread."""
+        self.pages.put(page)
+
+    def apply(self, clustta, budget=None):
+        """Apply queued rows until the time budget runs out. Returns the number of rows applied."""
+        while True:
+            try:
+                self.rows.extend(self.pages.get_nowait())
+            except queue.Empty:
+                break
+
+        deadline = None if budget is None else time.perf_counter() + budget
+        applied = 0
+        while self.rows:
+            for _ in range(min(INGEST_BATCH, len(self.rows))):
+                a = self.rows.popleft()
+                if a is _END_OF_CACHE:
+                    # Cached rows are complete: show them as a finished list, then revalidate
+                    _finish_asset_load(clustta, self.finish())
+                    self.restart()
+                    continue
+                asset_id = a.get("id", "")
+                if asset_id in self.seen:
+                    continue
+                self.seen.add(asset_id)
+                self.order.append(asset_id)
+                if asset_store.upsert(a):
+                    self.changed += 1
+                applied += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return applied
+
+    def restart(self):
+        """Start a new generation of rows against the current store."""
+        self.order = []
+        self.seen = set()
+        self.changed = 0
+
+    def finish(self):
+        """Remove rows missing from the stream and restore bridge order. Returns the number of changed rows."""
+        self.changed += asset_store.retain(self.order)
+        return self.changed
+
+
+def reconcile_assets(clustta, assets):
+    """Update the asset store in place to match a bridge response, keyed by asset id.
+
+    Only added, removed or modified rows are written and the bridge order is
+    kept. Returns the number of rows that changed.
+    """
+    ingest = _AssetIngest()
+    ingest.feed(assets or [])
+    ingest.apply(clustta)
+    return ingest.finish()
+
+
+def _finish_asset_load(clustta, changed):
+    """Record a completed asset load and rebuild dependent state and the visible window."""
     global _loaded_assets_project_id
-    client = api_client.get_client()
-    assets, err = client.get_assets(ext=".blend")
+    _loaded_assets_project_id = clustta.active_project_id
+    events.subscribe(clustta.active_project_id)
+    if changed:
+        from . import props
+        props.update_filter_items(asset_store)
+        _selected_ids.difference_update([a for a in _selected_ids if asset_store.row_of(a) is None])
+        _build_search_index()
+        scanner.track(_scanned_files(enumerate(asset_store.ids)))
+    refresh_asset_window(clustta)
 
-    if err:
-        return False, err
 
+def _build_search_index():
+    """Build the search index for the stored names on a worker; searches scan the names until it is in."""
+    search.invalidate_index()
+    names = list(asset_store.names())
+    jobs.submit(
+        ("search-index", asset_store.version), search.NameIndex, names,
+        on_done=lambda index: _install_search_index(index, names),
+    )
+
+
+def _install_search_index(index, names):
+    """Use a finished search index if the names it was built from are still the stored ones."""
+    global _filtered
+    if names != asset_store.names():
+        # Whatever changed the names has started a newer build
+        return
+    search.set_index(index)
+    _filtered = (None, [])
+    clustta = _active_clustta()
+    if clustta is not None and clustta.search_query.strip():
+        refresh_asset_window(clustta)
+
+
+def _scanned_files(rows):
+    """Return the (asset_id, path, bridge_state) the scanner tracks for (row, asset_id) pairs."""
+    return (
+        (asset_id, bpy.path.abspath(asset_store.get(row, "file_path")), asset_store.get(row, "file_status"))
+        for row, asset_id in rows
+    )
+
+
+def _finish_asset_deltas(clustta, changed_ids, removed_ids):
+    """Update state derived from the store after per-asset deltas, touching only the changed assets."""
+    from . import props
+    # Cheap: the store keeps per-value counts
+    props.update_filter_items(asset_store)
+    if removed_ids:
+        _selected_ids.difference_update(removed_ids)
+        scanner.forget(removed_ids)
+    rows = [(asset_store.row_of(asset_id), asset_id) for asset_id in changed_ids]
+    rows = [(row, asset_id) for row, asset_id in rows if row is not None]
+    if removed_ids or search.get_index() is None:
+        # Removing rows renumbers the ones after them, and a build in flight has the old names
+        _build_search_index()
+    else:
+        search.update_index(asset_store.names(), [row for row, _ in rows])
+    scanner.update(_scanned_files(rows))
+    refresh_asset_window(clustta)
+
+
+def _filtered_rows(clustta):
+    """Return the store rows passing the type and status filters and the search box, best match first."""
+    global _filtered
+    query = clustta.search_query.strip()
+    key = (asset_store.version, clustta.filter_asset_type, clustta.filter_status, query)
+    if _filtered[0] == key:
+        return _filtered[1]
+
+    filters = []
+    if clustta.filter_asset_type != "ALL":
+        filters.append(("task_type_name", clustta.filter_asset_type))
+    if clustta.filter_status != "ALL":
+        filters.append(("status_short_name", clustta.filter_status))
+    if query:
+        index = search.get_index()
+        if index is not None and len(index) == len(asset_store):
+            rows = index.search(query)
+        else:
+            rows = search.scan(asset_store.names(), query)
+        if filters:
+            rows = rows.where(asset_store.mask(filters))
+    else:
+        rows = asset_store.rows_where(filters)
+    _filtered = (key, rows)
+    return rows
+
+
+@metrics.timed("helpers.refresh_asset_window")
+def refresh_asset_window(clustta):
+    """Show the current page of filtered assets in the UI list, keeping the active asset selected."""
+    global _offpage_active_id
+    rows = _filtered_rows(clustta)
+    start = clustta.asset_page * ASSET_WINDOW_SIZE
+    window = rows[start:start + ASSET_WINDOW_SIZE]
+    if not window and start:
+        # Past the last page, e.g. after the matches shrank; only then are all matches counted
+        clustta.asset_page = max(0, len(rows) - 1) // ASSET_WINDOW_SIZE
+        start = clustta.asset_page * ASSET_WINDOW_SIZE
+        window = rows[start:start + ASSET_WINDOW_SIZE]
+
+    # The active asset stays remembered while it is on another page
+    active_id = selected_asset_id(clustta) or _offpage_active_id
+    items = clustta.assets
+    for i in range(len(items) - 1, len(window) - 1, -1):
+        items.remove(i)
+    for i, row in enumerate(window):
+        _write_window_item(items[i] if i < len(items) else items.add(), row)
+
+    ids = asset_store.ids
+    new_index = next((i for i, row in enumerate(window) if ids[row] == active_id), -1) if active_id else -1
+    _offpage_active_id = active_id if new_index < 0 and asset_store.row_of(active_id) is not None else ""
+    if clustta.active_asset_index != new_index:
+        clustta.active_asset_index = new_index
+
+
+def asset_window_range(clustta):
+    """Return (first, last, total): the 1-based rows the list shows out of all filtered assets."""
+    total = len(_filtered_rows(clustta))
+    if not total:
+        return 0, 0, 0
+    first = clustta.asset_page * ASSET_WINDOW_SIZE + 1
+    return first, first + len(clustta.assets) - 1, total
+
+
+def clear_assets(clustta):
+    """Empty the asset store and the list, e.g. when the studio or project changes."""
+    global _shown_asset_pages, _offpage_active_id
+    asset_store.clear()
+    search.invalidate_index()
+    _offpage_active_id = ""
+    _selected_ids.clear()
+    _shown_asset_pages = ("", [])
     clustta.assets.clear()
     clustta.active_asset_index = -1
+    clustta.asset_page = 0
 
-    for a in (assets or []):
-        item = clustta.assets.add()
-        item.asset_id = a.get("id", "")
-        item.name = a.get("name", "")
-        item.file_path = a.get("file_path", "")
-        item.asset_type = a.get("task_type_name", "")
-        item.status = a.get("status_short_name", "")
-        item.file_state = a.get("file_status", "")
 
-    _loaded_assets_project_id = clustta.active_project_id
+def is_asset_selected(asset_id):
+    """Return True if the asset is ticked for batch actions."""
+    return asset_id in _selected_ids
 
-    from . import props
-    props.update_filter_items(clustta.assets)
 
-    return True, None
+def set_asset_selected(asset_id, selected):
+    """Tick or untick an asset for batch actions."""
+    if selected:
+        _selected_ids.add(asset_id)
+    else:
+        _selected_ids.discard(asset_id)
 
 
-def ensure_assets_loaded(clustta):
-    """Load assets if not already loaded for the current project."""
-    global _loaded_assets_project_id
-    if _loaded_assets_project_id == clustta.active_project_id and len(clustta.assets) > 0:
+def select_filtered_assets(clustta):
+    """Tick every asset passing the current filters and search, on all pages."""
+    ids = asset_store.ids
+    _selected_ids.update(ids[row] for row in _filtered_rows(clustta))
+
+
+def clear_asset_selection():
+    """Untick all assets."""
+    _selected_ids.clear()
+
+
+def selected_asset_count():
+    """Return the number of ticked assets."""
+    return len(_selected_ids)
+
+
+def selected_asset_rows():
+    """Return the store rows of the ticked assets that are still loaded, in list order."""
+    rows = (asset_store.row_of(asset_id) for asset_id in _selected_ids)
+    return sorted(row for row in rows if row is not None)
+
+
+def apply_file_states(changes):
+    """Write scanned file states ({asset_id: file_state}) into the store and the visible rows."""
+    for asset_id, state in changes.items():
+        asset_store.set(asset_id, "file_status", state)
+    # The files changed on disk, so their embedded previews may have too
+    thumbnails.invalidate(changes)
+    clustta = _active_clustta()
+    if clustta is None:
         return
-    load_assets(clustta)
+    for item in clustta.assets:
+        state = changes.get(item.asset_id)
+        if state is not None and item.file_state != state:
+            item.file_state = state
 
 
-def load_checkpoints(clustta, asset_id):
-    """Fetch checkpoints for an asset and populate the collection."""
-    global _loaded_checkpoint_asset_id
+def _apply_assets(clustta, assets):
+    """Reconcile the asset store with a bridge response. Returns the number of changed rows."""
+    changed = reconcile_assets(clustta, assets)
+    _finish_asset_load(clustta, changed)
+    return changed
+
+
+def _add_checkpoint_items(clustta, checkpoints):
+    """Append bridge checkpoints to the checkpoint collection."""
+    for cp in (checkpoints or []):
+        item = clustta.checkpoints.add()
+        item.checkpoint_id = cp.get("id", "")
+        item.message = cp.get("comment", "")
+        item.created_at = _format_timestamp(cp.get("created_at", ""))
+        item.author = cp.get("author_id", "")
+
+
+def _apply_checkpoints(clustta, asset_id, checkpoints, next_offset=None):
+    """Populate the checkpoint collection from the first page of a bridge response."""
+    global _loaded_checkpoint_asset_id, _checkpoint_next_offset
+    clustta.checkpoints.clear()
+    clustta.active_checkpoint_index = -1
+    _add_checkpoint_items(clustta, checkpoints)
+    _loaded_checkpoint_asset_id = asset_id
+    _checkpoint_next_offset = next_offset
+    blobs.prefetch(clustta.active_project_id, asset_id, checkpoints or [])
+
+
+def _fetch_all_assets(client):
+    """Fetch every asset page synchronously. Returns (assets, error)."""
+    assets = []
+    for page, err in client.iter_asset_pages(ext=".blend"):
+        if err:
+            return None, err
+        assets.extend(page)
+    return assets, None
+
+
+@metrics.timed("helpers.load_assets")
+def load_assets(clustta):
+    """Fetch assets from bridge and update the asset store and list.
+
+    Returns (changed, error) where changed is the number of rows added, removed or modified.
+    """
+    client = api_client.get_client()
+    assets, err = _fetch_all_assets(client)
+
+    if err:
+        return 0, err
+
+    return _apply_assets(clustta, assets), None
+
+
+def _cache_scope(clustta):
+    """Return the account, studio and project a cache entry belongs to."""
+    return (clustta.active_account_id, clustta.active_studio_id, clustta.active_project_id)
+
+
+def _stream_asset_pages(ingest, use_cache):
+    """Worker: queue cached assets, then fetch live pages until done or cancelled."""
+    previous = ingest.previous_pages
+    if use_cache:
+        cached = cache.load("assets", *ingest.scope)
+        if cached:
+            ingest.feed(cached)
+            ingest.feed([_END_OF_CACHE])
+            previous = []
+
+    # Pages the bridge answered 304 for come back as the identical list object.
+    # Hold those back; if every page is unchanged, the store needs no work.
+    held = []
     client = api_client.get_client()
-    checkpoints, err = client.get_checkpoints(asset_id)
+    for i, (page, err) in enumerate(client.iter_asset_pages(ext=".blend")):
+        if ingest.cancelled:
+            break
+        if err:
+            ingest.error = err
+            break
+        ingest.live_pages.append(page)
+        if held is not None and i < len(previous) and page is previous[i]:
+            held.append(page)
+            continue
+        for p in held or ():
+            ingest.feed(p)
+        held = None
+        ingest.feed(page)
+    else:
+        if held is not None and len(ingest.live_pages) == len(previous):
+            ingest.unchanged = True
+        else:
+            for p in held or ():
+                ingest.feed(p)
+            cache.store("assets", *ingest.scope, data=[a for p in ingest.live_pages for a in p])
+    ingest.fetched = True
+
+
+def warm_asset_cache(scope):
+    """Worker: fetch the assets of a project other than the active one into the disk cache. Returns an error or None.
+
+    Switching to the project then shows them at once while they are revalidated.
+    """
+    assets = []
+    for page, err in api_client.get_client().iter_asset_pages(ext=".blend", project_id=scope[2]):
+        if err:
+            return err
+        assets.extend(page)
+    cache.store("assets", *scope, data=assets)
+    return None
+
+
+@metrics.timed("helpers.ingest_tick")
+def _ingest_tick():
+    """Timer callback: apply a time slice of streamed asset rows on the main thread."""
+    global _asset_ingest, _last_asset_load, _loaded_assets_project_id, _shown_asset_pages
+    ingest = _asset_ingest
+    if ingest is None or ingest.cancelled:
+        return None
+
+    clustta = _active_clustta()
+    # Drop the stream if the project changed while it was in flight
+    if clustta is None or clustta.active_project_id != ingest.project_id:
+        ingest.cancelled = True
+        _asset_ingest = None
+        _deferred_events.clear()
+        return None
+
+    # Read the flag before draining so no page queued after it is missed
+    fetched = ingest.fetched
+    if ingest.apply(clustta, INGEST_BUDGET):
+        # Fill the first page while rows arrive; the full window is refreshed when the load finishes
+        if len(clustta.assets) < ASSET_WINDOW_SIZE and not clustta.search_query.strip():
+            refresh_asset_window(clustta)
+        jobs.tag_redraw()
+
+    if not fetched or not ingest.pages.empty() or ingest.rows:
+        return INGEST_INTERVAL
+
+    if ingest.error:
+        # Keep whatever was shown; don't retry from every redraw, the refresh button resets the cache
+        _loaded_assets_project_id = ingest.project_id
+        _last_asset_load = (0, ingest.error)
+    elif ingest.unchanged:
+        _loaded_assets_project_id = ingest.project_id
+        _last_asset_load = (0, None)
+    else:
+        changed = ingest.finish()
+        _finish_asset_load(clustta, changed)
+        _last_asset_load = (changed, None)
+        _shown_asset_pages = (ingest.project_id, ingest.live_pages)
+    _asset_ingest = None
+    if _deferred_events:
+        deferred = _deferred_events[:]
+        _deferred_events.clear()
+        apply_events(clustta, deferred)
+    jobs.tag_redraw()
+    return None
+
+
+def request_assets(clustta, use_cache=True):
+    """Stream assets on a worker thread into the store, a time slice per timer tick.
+
+    With use_cache, assets cached on disk for the project are shown first and
+    then revalidated against the bridge. The first rows appear as soon as they
+    are available; the UI stays responsive while large projects load.
+    """
+    global _asset_ingest
+    project_id = clustta.active_project_id
+    if _asset_ingest is not None:
+        if _asset_ingest.project_id == project_id and not _asset_ingest.cancelled:
+            return
+        _asset_ingest.cancelled = True
+
+    # Unchanged pages can only be skipped if the store still holds them
+    shown_project_id, shown_pages = _shown_asset_pages
+    if shown_project_id != project_id or len(asset_store) != sum(len(p) for p in shown_pages):
+        shown_pages = None
+
+    _asset_ingest = _AssetIngest(project_id, _cache_scope(clustta), shown_pages)
+    jobs.submit(("assets", project_id, id(_asset_ingest)), _stream_asset_pages, _asset_ingest, use_cache)
+    if not bpy.app.timers.is_registered(_ingest_tick):
+        bpy.app.timers.register(_ingest_tick, first_interval=INGEST_INTERVAL)
+
+
+def assets_loading(clustta):
+    """Return True while assets for the active project are being streamed in."""
+    return _asset_ingest is not None and _asset_ingest.project_id == clustta.active_project_id
+
+
+def last_asset_load():
+    """Return (changed, error) for the most recently completed background asset load."""
+    return _last_asset_load
+
+
+def ensure_assets_loaded(clustta):
+    """Request assets in the background if not already loaded for the current project."""
+    if _loaded_assets_project_id == clustta.active_project_id:
+        return
+    request_assets(clustta)
+
+
+def _apply_asset_events(upserts, removals):
+    """Apply per-asset deltas to the store in place. Returns the ids of changed and of removed assets."""
+    changed = [asset_id for asset_id, a in upserts.items() if asset_store.upsert(a)]
+    removed = [asset_id for asset_id in removals if asset_store.row_of(asset_id) is not None]
+    asset_store.remove(removed)
+    return changed, removed
+
+
+def _apply_checkpoint_created(clustta, asset_id, cp):
+    """Put a new checkpoint at the top of the cached and displayed history of its asset."""
+    global _checkpoint_next_offset
+    loaded = _checkpoint_cache.peek(asset_id)
+    if loaded is not None:
+        _checkpoint_cache.put(asset_id, ([cp] + loaded[0], loaded[1] + 1 if loaded[1] is not None else None))
+    if _loaded_checkpoint_asset_id != asset_id:
+        return
+    if any(item.checkpoint_id == cp.get("id") for item in clustta.checkpoints):
+        return
+    _add_checkpoint_items(clustta, [cp])
+    clustta.checkpoints.move(len(clustta.checkpoints) - 1, 0)
+    if clustta.active_checkpoint_index >= 0:
+        clustta.active_checkpoint_index += 1
+    # Older pages shifted down by one
+    if _checkpoint_next_offset is not None:
+        _checkpoint_next_offset += 1
+
+
+def apply_events(clustta, changes):
+    """Apply change events from the bridge to the asset store and the checkpoint collection.
+
+    Events are {"type": "asset.updated", "asset": {...}},
+    {"type": "asset.removed", "asset_id": ...} or
+    {"type": "checkpoint.created", "asset_id": ..., "checkpoint": {...}}.
+    Successive events for one asset collapse into its latest state.
+    """
+    global _shown_asset_pages
+    if _asset_ingest is not None:
+        # The stream is rebuilding the store; apply once it is done
+        _deferred_events.extend(changes)
+        return
+
+    upserts = {}
+    removals = set()
+    for event in changes:
+        kind = event.get("type")
+        if kind == "asset.updated":
+            a = event.get("asset") or {}
+            asset_id = a.get("id", "")
+            if asset_id:
+                upserts[asset_id] = a
+                removals.discard(asset_id)
+        elif kind == "asset.removed":
+            asset_id = event.get("asset_id", "")
+            upserts.pop(asset_id, None)
+            removals.add(asset_id)
+        elif kind == "checkpoint.created":
+            _apply_checkpoint_created(clustta, event.get("asset_id", ""), event.get("checkpoint") or {})
+
+    changed, removed = _apply_asset_events(upserts, removals)
+    if changed or removed:
+        # The store no longer mirrors the last fetched pages
+        _shown_asset_pages = ("", [])
+        _finish_asset_deltas(clustta, changed, removed)
+    jobs.tag_redraw()
+
+
+def selected_asset_id(clustta):
+    """Return the asset_id of the active asset row, or an empty string."""
+    if 0 <= clustta.active_asset_index < len(clustta.assets):
+        return clustta.assets[clustta.active_asset_index].asset_id
+    return ""
+
+
+def _fetch_checkpoint_page(asset_id, offset, scope):
+    """Worker: fetch a page of an asset's checkpoints, caching the first page on success."""
+    page, err = api_client.get_client().get_checkpoint_page(asset_id, offset, CHECKPOINT_PAGE_SIZE)
+    if not err and offset == 0:
+        checkpoints, next_offset = page
+        cache.store("checkpoints", *scope, asset_id, data={"checkpoints": checkpoints, "next_offset": next_offset})
+    return page, err
+
+
+def _merge_first_checkpoint_page(loaded, checkpoints, next_offset):
+    """Return the cache entry for a fresh first page, keeping older pages Load More already added."""
+    checkpoints = list(checkpoints)
+    if loaded is None or len(loaded[0]) <= len(checkpoints):
+        return checkpoints, next_offset
+    ids = {cp.get("id") for cp in checkpoints}
+    return checkpoints + [cp for cp in loaded[0] if cp.get("id") not in ids], loaded[1]
+
+
+def _submit_first_checkpoint_page(clustta, asset_id):
+    """Fetch an asset's first checkpoint page; show it on arrival if the asset is selected.
+
+    A response that arrives after the account, studio or project changed is dropped.
+    """
+    scope = _cache_scope(clustta)
+
+    def on_done(result):
+        page, err = result
+        current = _active_clustta()
+        if err or current is None or _cache_scope(current) != scope:
+            return
+        entry = _merge_first_checkpoint_page(_checkpoint_cache.peek(asset_id), *page)
+        _checkpoint_cache.put(asset_id, entry)
+        if selected_asset_id(current) == asset_id:
+            _apply_checkpoints(current, asset_id, *entry)
+
+    jobs.submit(("checkpoints", asset_id, 0), _fetch_checkpoint_page, asset_id, 0, scope, on_done=on_done)
+
+
+def request_checkpoints(clustta, asset_id):
+    """Show checkpoints for an asset, from the in-memory cache at once or via a worker thread.
+
+    On a miss, the disk cache is read on a worker and shown unless the bridge
+    answered first, then revalidated.
+    """
+    global _loaded_checkpoint_asset_id, _checkpoint_next_offset
+    page = _checkpoint_cache.get(asset_id)
+    if page is not None:
+        _apply_checkpoints(clustta, asset_id, *page)
+        return
 
     clustta.checkpoints.clear()
     clustta.active_checkpoint_index = -1
+    _loaded_checkpoint_asset_id = ""
+    _checkpoint_next_offset = None
+    scope = _cache_scope(clustta)
 
-    if not err and checkpoints:
-        for cp in checkpoints:
-            item = clustta.checkpoints.add()
-            item.checkpoint_id = cp.get("id", "")
-            item.message = cp.get("comment", "")
-            item.created_at = _format_timestamp(cp.get("created_at", ""))
-            item.author = cp.get("author_id", "")
+    def on_cached(cached):
+        current = _active_clustta()
+        if not isinstance(cached, dict) or current is None or _cache_scope(current) != scope:
+            return
+        if selected_asset_id(current) != asset_id or _loaded_checkpoint_asset_id == asset_id:
+            return
+        _apply_checkpoints(current, asset_id, cached.get("checkpoints"), cached.get("next_offset"))
 
-    _loaded_checkpoint_asset_id = asset_id
+    jobs.submit(("checkpoints-disk", asset_id), cache.load, "checkpoints", *scope, asset_id, on_done=on_cached)
+    _submit_first_checkpoint_page(clustta, asset_id)
 
 
-def ensure_checkpoints_loaded(clustta, asset_id):
-    """Load checkpoints if not already loaded for the current asset."""
+def prefetch_neighbor_checkpoints(clustta):
+    """Prefetch the first checkpoint page of the assets above and below the selection."""
+    index = clustta.active_asset_index
+    for neighbor in (index - 1, index + 1):
+        if not 0 <= neighbor < len(clustta.assets):
+            continue
+        asset_id = clustta.assets[neighbor].asset_id
+        if asset_id not in _checkpoint_cache:
+            _submit_first_checkpoint_page(clustta, asset_id)
+
+
+def request_more_checkpoints(clustta):
+    """Fetch the next page of the loaded asset's checkpoints and append it. Returns False if there is none."""
+    asset_id = _loaded_checkpoint_asset_id
+    offset = _checkpoint_next_offset
+    if not asset_id or offset is None:
+        return False
+
+    def on_done(result):
+        global _checkpoint_next_offset
+        page, err = result
+        current = _active_clustta()
+        # Drop the page if another asset was selected in the meantime
+        if err or current is None or _loaded_checkpoint_asset_id != asset_id or _checkpoint_next_offset != offset:
+            return
+        checkpoints, next_offset = page
+        _add_checkpoint_items(current, checkpoints)
+        _checkpoint_next_offset = next_offset
+
+        loaded = _checkpoint_cache.peek(asset_id)
+        if loaded is not None:
+            _checkpoint_cache.put(asset_id, (loaded[0] + list(checkpoints), next_offset))
+
+    jobs.submit(("checkpoints", asset_id, offset), _fetch_checkpoint_page, asset_id, offset, _cache_scope(clustta), on_done=on_done)
+    return True
+
+
+def has_more_checkpoints():
+    """Return True if the loaded asset has older checkpoints not yet fetched."""
+    return _checkpoint_next_offset is not None
+
+
+def checkpoints_loading(asset_id):
+    """Return True while a checkpoint request for the asset is in flight."""
+    return jobs.is_pending(("checkpoints", asset_id, 0)) or (
+        asset_id == _loaded_checkpoint_asset_id
+        and _checkpoint_next_offset is not None
+        and jobs.is_pending(("checkpoints", asset_id, _checkpoint_next_offset))
+    )
+
+
+def invalidate_checkpoints(asset_id):
+    """Forget the cached checkpoints of an asset, e.g. after a refresh or a new checkpoint."""
     global _loaded_checkpoint_asset_id
+    _checkpoint_cache.pop(asset_id)
     if _loaded_checkpoint_asset_id == asset_id:
-        return
-    load_checkpoints(clustta, asset_id)
+        _loaded_checkpoint_asset_id = ""
+
+
+def checkpoints_loaded_for(asset_id):
+    """Return True if the checkpoint collection already holds this asset's history."""
+    return _loaded_checkpoint_asset_id == asset_id
 
 
 def reset_asset_cache():
     """Reset the asset cache when switching projects or studios."""
-    global _loaded_assets_project_id
+    global _loaded_assets_project_id, _asset_ingest
     _loaded_assets_project_id = ""
+    _deferred_events.clear()
+    events.unsubscribe()
+    thumbnails.forget_missing()
+    if _asset_ingest is not None:
+        _asset_ingest.cancelled = True
+        _asset_ingest = None
 
 
 def reset_checkpoint_cache():
-    """Reset the checkpoint cache when switching assets."""
-    global _loaded_checkpoint_asset_id
+    """Reset the checkpoint caches when switching projects or studios, or refreshing assets."""
+    global _loaded_checkpoint_asset_id, _checkpoint_next_offset
     _loaded_checkpoint_asset_id = ""
+    _checkpoint_next_offset = None
+    _checkpoint_cache.clear()
+
+
+def checkpoint_cache_stats():
+    """Return entry count and hit/miss counters of the in-memory checkpoint cache."""
+    return _checkpoint_cache.stats()
 
 
 def get_file_state_icon(file_state):
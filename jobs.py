@@ -0,0 +1,112 @@
+"""Background worker pool for bridge requests, with results delivered on Blender's main thread."""
+
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+MAX_WORKERS = 6
+# Threads for the requests of one gather() call
+GATHER_WORKERS = 6
+POLL_INTERVAL = 0.05
+
+_executor = None
+_gather_executor = None
+_results = queue.Queue()
+_pending = set()
+
+
+def _get_executor():
+    """Get or create the shared worker pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="clustta")
+    return _executor
+
+
+def submit(key, fn, *args, on_done=None):
+    """Run fn(*args) on a worker thread and pass its result to on_done on the main thread.
+
+    Only one job per key runs at a time; returns False if the key is already in flight.
+    Must be called from the main thread.
+    """
+    if key in _pending:
+        return False
+    _pending.add(key)
+
+    future = _get_executor().submit(fn, *args)
+    future.add_done_callback(lambda f: _results.put((key, f, on_done)))
+
+    if not bpy.app.timers.is_registered(_drain):
+        bpy.app.timers.register(_drain, first_interval=POLL_INTERVAL)
+    return True
+
+
+def gather(*calls):
+    """Run (fn, *args) calls concurrently and wait for every result, returned in call order.
+
+    Meant for jobs started with submit(): it blocks its caller, so must not be
+    called from the main thread. The calls run on their own threads, so they
+    neither wait behind long jobs of the shared pool nor deadlock a job that
+    gathers from inside it.
+    """
+    global _gather_executor
+    if _gather_executor is None:
+        _gather_executor = ThreadPoolExecutor(max_workers=GATHER_WORKERS, thread_name_prefix="clustta-gather")
+    futures = [_gather_executor.submit(fn, *args) for fn, *args in calls]
+    return [f.result() for f in futures]
+
+
+def is_pending(key):
+    """Return True while a job with this key is running or awaiting delivery."""
+    return key in _pending
+
+
+def _drain():
+    """Timer callback: deliver finished jobs to their callbacks on the main thread."""
+    delivered = False
+    while True:
+        try:
+            key, future, on_done = _results.get_nowait()
+        except queue.Empty:
+            break
+
+        _pending.discard(key)
+        delivered = True
+        try:
+            result = future.result()
+            if on_done is not None:
+                on_done(result)
+        except Exception:
+            traceback.print_exc()
+
+    if delivered:
+        tag_redraw()
+
+    return POLL_INTERVAL if _pending else None
+
+
+def tag_redraw():
+    """Redraw the 3D Viewport sidebars so panels pick up new data."""
+    wm = getattr(bpy.context, "window_manager", None)
+    if wm is None:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def shutdown():
+    """Stop the worker pools and drop any undelivered results."""
+    global _executor, _gather_executor
+    if bpy.app.timers.is_registered(_drain):
+        bpy.app.timers.unregister(_drain)
+    for executor in (_executor, _gather_executor):
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    _executor = _gather_executor = None
+    _pending.clear()
+    while not _results.empty():
+        _results.get_nowait()
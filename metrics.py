@@ -0,0 +1,196 @@
+"""Latency and traffic metrics for bridge requests and expensive UI hooks."""
+
+import contextlib
+import functools
+import json
+import platform
+import threading
+import time
+
+# Upper bounds of the latency histogram buckets, in milliseconds; the last bucket is open
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Path segments that name an endpoint rather than an id
+_ENDPOINT_WORDS = {
+    "health", "session", "events", "accounts", "studios", "projects",
+    "assets", "checkpoints", "chunks", "switch", "active", "missing",
+}
+_lock = threading.Lock()
+_requests = {}
+_hooks = {}
+_started_at = time.time()
+
+
+class Histogram:
+    """Latency histogram over fixed, roughly logarithmic buckets."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, seconds):
+        ms = seconds * 1000.0
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        for i, bound in enumerate(BUCKET_BOUNDS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, p):
+        """Estimate a percentile in milliseconds as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return min(float(BUCKET_BOUNDS_MS[i]), self.max) if i < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+            "buckets_ms": dict(zip([str(b) for b in BUCKET_BOUNDS_MS] + ["inf"], self.buckets)),
+        }
+
+
+class _EndpointStats:
+    def __init__(self):
+        self.latency = Histogram()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+
+def endpoint_name(method, path):
+    """Return the endpoint a request belongs to, e.g. "GET /assets/{id}/checkpoints"."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    template = "/".join(s if s in _ENDPOINT_WORDS else "{id}" for s in segments if s)
+    return f"{method} /{template}"
+
+
+def _endpoint_stats(method, path):
+    """Return the stats of a request's endpoint, creating them if needed. Caller holds the lock."""
+    name = endpoint_name(method, path)
+    stats = _requests.get(name)
+    if stats is None:
+        stats = _requests[name] = _EndpointStats()
+    return stats
+
+
+def record_request(method, path, seconds, sent=0, received=0, error=None, timed_out=False):
+    """Record one bridge request. Safe to call from worker threads."""
+    with _lock:
+        stats = _endpoint_stats(method, path)
+        stats.latency.add(seconds)
+        stats.bytes_sent += sent
+        stats.bytes_received += received
+        if error:
+            stats.errors += 1
+        if timed_out:
+            stats.timeouts += 1
+
+
+def record_coalesced(method, path):
+    """Record a request that was answered by an identical one already in flight."""
+    with _lock:
+        _endpoint_stats(method, path).coalesced += 1
+
+
+def record_rejected(method, path):
+    """Record a request failed without contacting the bridge because it is considered down."""
+    with _lock:
+        _endpoint_stats(method, path).rejected += 1
+
+
+def record_hook(name, seconds):
+    """Record the duration of one call of a UI hook."""
+    with _lock:
+        hist = _hooks.get(name)
+        if hist is None:
+            hist = _hooks[name] = Histogram()
+        hist.add(seconds)
+
+
+@contextlib.contextmanager
+def timer(name):
+    """Context manager recording the wall time of its block under name.
+
+    Use it inside Blender callbacks (draw, execute, filter_items): Blender
+    checks their signatures on registration, so they cannot be wrapped.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_hook(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """Decorator recording the wall time of every call under name. Not for registered Blender callbacks."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """Return every metric as a JSON-serialisable dict."""
+    with _lock:
+        requests = {
+            name: {
+                **s.latency.as_dict(),
+                "bytes_sent": s.bytes_sent,
+                "bytes_received": s.bytes_received,
+                "errors": s.errors,
+                "timeouts": s.timeouts,
+                "coalesced": s.coalesced,
+                "rejected": s.rejected,
+            }
+            for name, s in sorted(_requests.items())
+        }
+        hooks = {name: h.as_dict() for name, h in sorted(_hooks.items())}
+    return {
+        "collected_since": _started_at,
+        "exported_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests": requests,
+        "hooks": hooks,
+    }
+
+
+def export(path, extra=None):
+    """Write a snapshot of the metrics to a JSON file, with optional extra fields."""
+    data = snapshot()
+    if extra:
+        data.update(extra)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def reset():
+    """Forget every recorded metric."""
+    global _started_at
+    with _lock:
+        _requests.clear()
+        _hooks.clear()
+        _started_at = time.time()
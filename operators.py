@@ -1,10 +1,13 @@
 """Clustta operators : actions triggered from UI panels."""
 
+import os
+
 import bpy
-from bpy.props import EnumProperty, StringProperty
+from bpy.props import EnumProperty, IntProperty, StringProperty
 from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
 
-from . import api_client, helpers
+from . import api_client, batch, blobs, connection, helpers, jobs, metrics, push, selector_cache, session
 
 
 # Dynamic enum caches (Blender requires the list to stay alive)
@@ -26,7 +29,9 @@ class CLUSTTA_OT_ConnectBridge(Operator):
         ok, err = client.health_check()
         if ok:
             clustta.bridge_connected = True
-            _sync_active_state(clustta, client)
+            connection.mark_connected()
+            # Selectors keep showing the last known lists until the bridge's arrive
+            session.revalidate()
             self.report({"INFO"}, "Connected to Clustta Bridge")
         else:
             clustta.bridge_connected = False
@@ -55,9 +60,15 @@ class CLUSTTA_OT_SwitchAccount(Operator):
             self.report({"WARNING"}, f"Failed to switch account: {err}")
             return {"CANCELLED"}
 
-        # Refresh active state
         clustta = context.scene.clustta
-        _sync_active_state(clustta, client)
+        for account_id, label, _ in _account_items:
+            if account_id == self.account:
+                clustta.active_account = label
+                break
+        clustta.active_account_id = self.account
+        _refresh_studio_items(clustta, client)
+        # Active studio and project follow from the bridge in the background
+        session.revalidate()
         self.report({"INFO"}, f"Switched to {clustta.active_account}")
         return {"FINISHED"}
 
@@ -88,11 +99,12 @@ class CLUSTTA_OT_SwitchStudio(Operator):
         # Clear downstream selections and caches
         clustta.active_project = ""
         clustta.active_project_id = ""
-        clustta.assets.clear()
+        helpers.clear_assets(clustta)
         clustta.checkpoints.clear()
         helpers.reset_asset_cache()
         helpers.reset_checkpoint_cache()
-        _refresh_project_items(client)
+        _refresh_project_items(clustta, client)
+        session.save(clustta)
         self.report({"INFO"}, f"Switched to studio: {self.studio}")
         return {"FINISHED"}
 
@@ -125,15 +137,23 @@ class CLUSTTA_OT_SwitchProject(Operator):
                 break
 
         clustta = context.scene.clustta
+        project_changed = clustta.active_project_id != self.project
         clustta.active_project = name
         clustta.active_project_id = self.project
 
-        # Load assets for the new project
+        # The previous project's rows must not stay listed, or be acted on, under the new one
+        if project_changed:
+            helpers.clear_assets(clustta)
+            clustta.checkpoints.clear()
+
+        # Stream assets for the new project in the background
         helpers.reset_asset_cache()
         helpers.reset_checkpoint_cache()
-        ok, _ = helpers.load_assets(clustta)
-        count = len(clustta.assets) if ok else 0
-        self.report({"INFO"}, f"Switched to project: {name} ({count} assets)")
+        helpers.request_assets(clustta)
+        session.save(clustta)
+        selector_cache.note_project(clustta)
+        selector_cache.warm_up(clustta)
+        self.report({"INFO"}, f"Switched to project: {name}")
         return {"FINISHED"}
 
 
@@ -143,6 +163,8 @@ class CLUSTTA_OT_RefreshAssets(Operator):
     bl_idname = "clustta.refresh_assets"
     bl_label = "Refresh Assets"
 
+    _timer = None
+
     def execute(self, context):
         clustta = context.scene.clustta
 
@@ -150,14 +172,45 @@ class CLUSTTA_OT_RefreshAssets(Operator):
             self.report({"WARNING"}, "No project selected")
             return {"CANCELLED"}
 
+        # Assets stream in on timer ticks; wait for the load to finish without blocking the UI
         helpers.reset_asset_cache()
-        ok, err = helpers.load_assets(clustta)
+        helpers.reset_checkpoint_cache()
+        helpers.request_assets(clustta, use_cache=False)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
 
-        if not ok:
+    def modal(self, context, event):
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        clustta = context.scene.clustta
+        if helpers.assets_loading(clustta):
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+        changed, err = helpers.last_asset_load()
+        if err:
             self.report({"WARNING"}, f"Failed to load assets: {err}")
             return {"CANCELLED"}
 
-        self.report({"INFO"}, f"Loaded {len(clustta.assets)} assets")
+        self.report({"INFO"}, f"Loaded {len(helpers.asset_store)} assets ({changed} changed)")
+        return {"FINISHED"}
+
+
+class CLUSTTA_OT_AssetPage(Operator):
+    """Show the previous or next page of tasks."""
+
+    bl_idname = "clustta.asset_page"
+    bl_label = "Change Page"
+
+    step: IntProperty(name="Step", default=1)  # type: ignore[valid-type]
+
+    def execute(self, context):
+        clustta = context.scene.clustta
+        clustta.asset_page = max(0, clustta.asset_page + self.step)
+        helpers.refresh_asset_window(clustta)
         return {"FINISHED"}
 
 
@@ -175,9 +228,22 @@ class CLUSTTA_OT_RefreshCheckpoints(Operator):
             return {"CANCELLED"}
 
         asset = clustta.assets[clustta.active_asset_index]
-        helpers.reset_checkpoint_cache()
-        helpers.load_checkpoints(clustta, asset.asset_id)
-        self.report({"INFO"}, f"Loaded {len(clustta.checkpoints)} checkpoints")
+        helpers.invalidate_checkpoints(asset.asset_id)
+        helpers.request_checkpoints(clustta, asset.asset_id)
+        self.report({"INFO"}, "Refreshing checkpoints...")
+        return {"FINISHED"}
+
+
+class CLUSTTA_OT_LoadMoreCheckpoints(Operator):
+    """Load older checkpoints for the selected asset."""
+
+    bl_idname = "clustta.load_more_checkpoints"
+    bl_label = "Load More"
+
+    def execute(self, context):
+        if not helpers.request_more_checkpoints(context.scene.clustta):
+            self.report({"INFO"}, "No older checkpoints")
+            return {"CANCELLED"}
         return {"FINISHED"}
 
 
@@ -187,6 +253,8 @@ class CLUSTTA_OT_CreateCheckpoint(Operator):
     bl_idname = "clustta.create_checkpoint"
     bl_label = "Create Checkpoint"
 
+    _timer = None
+
     def execute(self, context):
         clustta = context.scene.clustta
         message = clustta.checkpoint_message
@@ -195,67 +263,460 @@ class CLUSTTA_OT_CreateCheckpoint(Operator):
             self.report({"WARNING"}, "Please enter a checkpoint message")
             return {"CANCELLED"}
 
-        # Checkpoint creation requires Phase 7 bridge endpoints
-        self.report({"INFO"}, f"Checkpoint creation not yet implemented: {message}")
+        if clustta.active_asset_index < 0 or clustta.active_asset_index >= len(clustta.assets):
+            self.report({"WARNING"}, "No asset selected")
+            return {"CANCELLED"}
+
+        if push.is_running() or batch.is_running():
+            self.report({"WARNING"}, "A checkpoint is already being pushed")
+            return {"CANCELLED"}
+
+        asset = clustta.assets[clustta.active_asset_index]
+        file_path = bpy.path.abspath(asset.file_path)
+
+        # Checkpoint the latest work when the asset is the open file
+        if bpy.data.is_dirty and bpy.data.filepath and os.path.normcase(bpy.data.filepath) == os.path.normcase(file_path):
+            bpy.ops.wm.save_mainfile()
+
+        if not os.path.isfile(file_path):
+            self.report({"WARNING"}, f"File not found: {file_path}")
+            return {"CANCELLED"}
+
+        asset_id = asset.asset_id
+
+        def on_done(result):
+            _, err = result
+            if err:
+                return
+            helpers.invalidate_checkpoints(asset_id)
+            current = bpy.context.scene.clustta
+            if 0 <= current.active_asset_index < len(current.assets) and current.assets[current.active_asset_index].asset_id == asset_id:
+                helpers.request_checkpoints(current, asset_id)
+
+        # Chunking, hashing and upload run in the background; progress shows in the panel
+        push.start(clustta.active_project_id, asset_id, message, file_path, on_done=on_done)
         clustta.checkpoint_message = ""
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        jobs.tag_redraw()
+        if push.is_running():
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+        progress = push.current_progress()
+        if progress.error:
+            self.report({"WARNING"}, f"Failed to create checkpoint: {progress.error}")
+            return {"CANCELLED"}
+
+        if progress.chunks:
+            self.report({"INFO"}, f"Checkpoint created ({progress.uploaded} of {progress.chunks} chunks uploaded)")
+        else:
+            self.report({"INFO"}, "Checkpoint created")
         return {"FINISHED"}
 
 
-def _refresh_account_items(client):
-    """Populate the account selector items from the bridge."""
+def _load_file(path):
+    """Timer callback: open or revert a .blend file outside of any running operator."""
+    if os.path.normcase(bpy.data.filepath) == os.path.normcase(path):
+        bpy.ops.wm.revert_mainfile()
+    else:
+        bpy.ops.wm.open_mainfile(filepath=path)
+    return None
+
+
+class CLUSTTA_OT_CheckpointFile(Operator):
+    """Open the selected checkpoint as a separate file, or restore it over the working file."""
+
+    bl_idname = "clustta.checkpoint_file"
+    bl_label = "Checkpoint File"
+
+    mode: EnumProperty(  # type: ignore[valid-type]
+        name="Mode",
+        items=[
+            ("OPEN", "Open", "Open the checkpoint as a separate, read-only copy"),
+            ("RESTORE", "Restore", "Replace the working file with the checkpoint"),
+        ],
+    )
+
+    _timer = None
+    _dest = ""
+
+    def invoke(self, context, event):
+        if self.mode == "RESTORE" or bpy.data.is_dirty:
+            return context.window_manager.invoke_confirm(self, event)
+        return self.execute(context)
+
+    def execute(self, context):
+        clustta = context.scene.clustta
+        if not 0 <= clustta.active_asset_index < len(clustta.assets) or not 0 <= clustta.active_checkpoint_index < len(clustta.checkpoints):
+            self.report({"WARNING"}, "No checkpoint selected")
+            return {"CANCELLED"}
+
+        if blobs.is_running():
+            self.report({"WARNING"}, "A checkpoint file is already being fetched")
+            return {"CANCELLED"}
+
+        asset = clustta.assets[clustta.active_asset_index]
+        checkpoint = clustta.checkpoints[clustta.active_checkpoint_index]
+        file_path = bpy.path.abspath(asset.file_path)
+        if self.mode == "RESTORE":
+            self._dest = file_path
+        else:
+            self._dest = blobs.opened_path(checkpoint.checkpoint_id, os.path.basename(file_path))
+
+        blobs.start(clustta.active_project_id, asset.asset_id, checkpoint.checkpoint_id, self._dest)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        jobs.tag_redraw()
+        if blobs.is_running():
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+        progress = blobs.current_progress()
+        if progress.error:
+            self.report({"WARNING"}, f"Failed to fetch checkpoint: {progress.error}")
+            return {"CANCELLED"}
+
+        if self.mode == "RESTORE":
+            self.report({"INFO"}, f"Restored checkpoint to {self._dest}")
+            if os.path.normcase(bpy.data.filepath) != os.path.normcase(self._dest):
+                return {"FINISHED"}
+        # Loading a file frees running operators, so it happens after this one returns
+        dest = self._dest
+        bpy.app.timers.register(lambda: _load_file(dest), first_interval=0.0)
+        return {"FINISHED"}
+
+
+class CLUSTTA_OT_SelectAssets(Operator):
+    """Tick all listed tasks, on every page, or untick all tasks."""
+
+    bl_idname = "clustta.select_assets"
+    bl_label = "Select Tasks"
+
+    action: EnumProperty(  # type: ignore[valid-type]
+        name="Action",
+        items=[
+            ("ALL", "All", "Tick every task matching the filters and search"),
+            ("NONE", "None", "Untick all tasks"),
+        ],
+    )
+
+    def execute(self, context):
+        if self.action == "ALL":
+            helpers.select_filtered_assets(context.scene.clustta)
+        else:
+            helpers.clear_asset_selection()
+        return {"FINISHED"}
+
+
+def _on_batch_done(progress):
+    """Main thread: drop cached checkpoint lists of the checkpointed assets and reload the shown one."""
+    for asset_id in progress.succeeded:
+        helpers.invalidate_checkpoints(asset_id)
+    current = bpy.context.scene.clustta
+    asset_id = helpers.selected_asset_id(current)
+    if asset_id in progress.succeeded:
+        helpers.request_checkpoints(current, asset_id)
+
+
+class CLUSTTA_OT_CreateCheckpoints(Operator):
+    """Create a checkpoint with the same message for every ticked task. Esc skips the tasks not started yet."""
+
+    bl_idname = "clustta.create_checkpoints"
+    bl_label = "Checkpoint Selected"
+
+    _timer = None
+    _names = None
+
+    def execute(self, context):
+        clustta = context.scene.clustta
+        message = clustta.checkpoint_message
+
+        if not message.strip():
+            self.report({"WARNING"}, "Please enter a checkpoint message")
+            return {"CANCELLED"}
+
+        rows = helpers.selected_asset_rows()
+        if not rows:
+            self.report({"WARNING"}, "No tasks selected")
+            return {"CANCELLED"}
+
+        if push.is_running() or batch.is_running():
+            self.report({"WARNING"}, "A checkpoint is already being pushed")
+            return {"CANCELLED"}
+
+        store = helpers.asset_store
+        assets = [(store.ids[row], bpy.path.abspath(store.get(row, "file_path"))) for row in rows]
+        self._names = {store.ids[row]: store.get(row, "name") for row in rows}
+
+        # Checkpoint the latest work when one of the assets is the open file
+        if bpy.data.is_dirty and bpy.data.filepath:
+            open_file = os.path.normcase(bpy.data.filepath)
+            if any(os.path.normcase(path) == open_file for _, path in assets):
+                bpy.ops.wm.save_mainfile()
+
+        batch.start(clustta.active_project_id, assets, message, on_done=_on_batch_done)
+        clustta.checkpoint_message = ""
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            batch.cancel()
+            return {"RUNNING_MODAL"}
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        jobs.tag_redraw()
+        if batch.is_running():
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self._timer)
+        progress = batch.current_progress()
+        for asset_id, err in progress.failed.items():
+            self.report({"WARNING"}, f"{self._names.get(asset_id, asset_id)}: {err}")
+
+        # An asset neither finished nor skipped failed in a way the batch could not record
+        if progress.failed or progress.skipped or progress.done != progress.total:
+            self.report({"WARNING"}, f"Created {len(progress.succeeded)} of {progress.total} checkpoints, {len(progress.failed)} failed, {progress.skipped} skipped")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Created {len(progress.succeeded)} checkpoints")
+        return {"FINISHED"}
+
+
+def _set_account_items(accounts):
+    """Populate the account selector items from a bridge response."""
     global _account_items
-    accounts, err = client.list_accounts()
-    if not err and accounts:
+    if accounts:
         _account_items = [
             (a["id"], f'{a.get("first_name", "")} {a.get("last_name", "")} ({a["email"]})', "")
             for a in accounts
         ]
 
 
-def _refresh_studio_items(client):
-    """Populate the studio selector items from the bridge."""
+def _set_studio_items(studios):
+    """Populate the studio selector items from a bridge response."""
     global _studio_items
-    studios, err = client.list_studios()
-    if not err and studios:
+    if studios:
         _studio_items = [
             (s["name"], s["name"], s.get("url", ""))
             for s in studios
         ]
 
 
-def _refresh_project_items(client):
-    """Populate the project selector items from the bridge."""
+def _set_project_items(projects):
+    """Populate the project selector items from a bridge response."""
     global _project_items
-    projects, err = client.list_projects()
-    if not err and projects:
+    if projects:
         _project_items = [
             (p["uri"], p["name"], p.get("working_directory", ""))
             for p in projects
         ]
 
 
+def _is_current(account_id, studio_id=None):
+    """Return True if the account, and studio if given, are still the active ones."""
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return False
+    clustta = scene.clustta
+    return clustta.active_account_id == account_id and studio_id in (None, clustta.active_studio_id)
+
+
+def _refresh_account_items(client):
+    """Show the cached account list at once and refresh it in the background if stale."""
+    def on_update(accounts):
+        _set_account_items(accounts)
+        jobs.tag_redraw()
+
+    _set_account_items(selector_cache.get(("accounts",), client.list_accounts, on_update=on_update))
+
+
+def _refresh_studio_items(clustta, client):
+    """Show the cached studio list of the active account at once and refresh it in the background if stale."""
+    global _studio_items
+    account_id = clustta.active_account_id
+
+    def on_update(studios):
+        _set_studio_items(studios)
+        jobs.tag_redraw()
+
+    def on_error(err):
+        global _studio_items
+        # Only replace the placeholder; a cached list stays usable
+        if _studio_items == loading:
+            _studio_items = [("__NONE__", "Could not load studios", err)]
+            jobs.tag_redraw()
+
+    loading = [("__NONE__", "Loading studios...", "")]
+    _studio_items = loading
+    _set_studio_items(selector_cache.get(
+        ("studios", account_id), client.list_studios,
+        on_update=on_update, on_error=on_error, is_current=lambda: _is_current(account_id),
+    ))
+
+
+def _refresh_project_items(clustta, client):
+    """Show the cached project list of the active studio at once and refresh it in the background if stale."""
+    global _project_items
+    account_id, studio_id = clustta.active_account_id, clustta.active_studio_id
+
+    def on_update(projects):
+        _set_project_items(projects)
+        jobs.tag_redraw()
+
+    def on_error(err):
+        global _project_items
+        # Only replace the placeholder; a cached list stays usable
+        if _project_items == loading:
+            _project_items = [("__NONE__", "Could not load projects", err)]
+            jobs.tag_redraw()
+
+    loading = [("__NONE__", "Loading projects...", "")]
+    _project_items = loading
+    _set_project_items(selector_cache.get(
+        ("projects", account_id, studio_id), client.list_projects,
+        on_update=on_update, on_error=on_error, is_current=lambda: _is_current(account_id, studio_id),
+    ))
+
+
+_SESSION_KEYS = ("accounts", "studios", "projects", "active_account", "active_studio", "active_project")
+
+
+def selector_items():
+    """Return the account, studio and project selector items, e.g. for the session snapshot."""
+    return {"accounts": _account_items, "studios": _studio_items, "projects": _project_items}
+
+
+def restore_selector_items(saved):
+    """Restore selector items returned by selector_items(), e.g. from the session snapshot."""
+    global _account_items, _studio_items, _project_items
+    _account_items = [tuple(i) for i in saved.get("accounts") or _account_items]
+    _studio_items = [tuple(i) for i in saved.get("studios") or _studio_items]
+    _project_items = [tuple(i) for i in saved.get("projects") or _project_items]
+
+
+def fetch_session_state(client, concurrent=True):
+    """Fetch selector lists and active selections as a dict of (data, error) per key.
+
+    Uses the bridge's single session snapshot when available, otherwise runs
+    the six independent requests, concurrently with jobs.gather. Blocks, so
+    it runs on a worker (see session.revalidate).
+    """
+    session, err = client.get_session()
+    if not err and isinstance(session, dict):
+        return {key: (session.get(key), None) for key in _SESSION_KEYS}
+
+    calls = (
+        (client.list_accounts,),
+        (client.list_studios,),
+        (client.list_projects,),
+        (client.get_active_account,),
+        (client.get_active_studio,),
+        (client.get_active_project,),
+    )
+    results = jobs.gather(*calls) if concurrent else [fn() for fn, in calls]
+    return dict(zip(_SESSION_KEYS, results))
+
+
 def _sync_active_state(clustta, client):
-    """Fetch active state from the bridge and populate selector caches."""
-    _refresh_account_items(client)
-    _refresh_studio_items(client)
-    _refresh_project_items(client)
+    """Fetch active state from the bridge and populate selector caches.
+
+    Blocks until the bridge answers; the addon itself uses session.revalidate.
+    """
+    apply_session_state(clustta, fetch_session_state(client))
 
-    active, err = client.get_active_account()
+
+def apply_session_state(clustta, state):
+    """Merge fetched session state into the selectors and scene properties, then snapshot it."""
+    # Everything is merged after all requests returned, so the UI never sees a half-updated state
+    for key, setter in (("accounts", _set_account_items), ("studios", _set_studio_items), ("projects", _set_project_items)):
+        data, err = state[key]
+        if not err:
+            setter(data)
+
+    active, err = state["active_account"]
     if not err and active:
         name = f'{active.get("first_name", "")} {active.get("last_name", "")}'.strip()
         clustta.active_account = name or active.get("email", "")
         clustta.active_account_id = active.get("id", "")
 
-    studio, err = client.get_active_studio()
+    studio, err = state["active_studio"]
     if not err and studio:
         clustta.active_studio = studio.get("name", "")
         clustta.active_studio_id = studio.get("name", "")
 
-    project, err = client.get_active_project()
+    project, err = state["active_project"]
     if not err and project:
         clustta.active_project = project.get("name", "")
         clustta.active_project_id = project.get("uri", "")
 
+    # Keep the lists for selectors shown later, e.g. after switching back to this studio
+    for key, scope in (("accounts", ()), ("studios", (clustta.active_account_id,)), ("projects", (clustta.active_account_id, clustta.active_studio_id))):
+        data, err = state[key]
+        if not err and data is not None:
+            selector_cache.put((key,) + scope, data)
+
+    session.save(clustta)
+    selector_cache.note_project(clustta)
+    selector_cache.warm_up(clustta)
+
+
+class CLUSTTA_OT_ExportMetrics(Operator, ExportHelper):
+    """Save request and draw-time metrics as JSON, e.g. to attach to a bug report."""
+
+    bl_idname = "clustta.export_metrics"
+    bl_label = "Export Metrics"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})  # type: ignore[valid-type]
+
+    def execute(self, context):
+        clustta = context.scene.clustta
+        extra = {
+            "blender": bpy.app.version_string,
+            "assets": len(helpers.asset_store),
+            "checkpoints": len(clustta.checkpoints),
+            "checkpoint_cache": helpers.checkpoint_cache_stats(),
+        }
+        try:
+            metrics.export(self.filepath, extra)
+        except OSError as e:
+            self.report({"ERROR"}, f"Could not write metrics: {e}")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Metrics saved to {self.filepath}")
+        return {"FINISHED"}
+
+
+class CLUSTTA_OT_ResetMetrics(Operator):
+    """Clear the collected request and draw-time metrics."""
+
+    bl_idname = "clustta.reset_metrics"
+    bl_label = "Reset Metrics"
+
+    def execute(self, context):
+        metrics.reset()
+        return {"FINISHED"}
+
 
 # Registration
 _classes = [
@@ -264,8 +725,15 @@ _classes = [
     CLUSTTA_OT_SwitchStudio,
     CLUSTTA_OT_SwitchProject,
     CLUSTTA_OT_RefreshAssets,
+    CLUSTTA_OT_AssetPage,
     CLUSTTA_OT_RefreshCheckpoints,
+    CLUSTTA_OT_LoadMoreCheckpoints,
     CLUSTTA_OT_CreateCheckpoint,
+    CLUSTTA_OT_CheckpointFile,
+    CLUSTTA_OT_SelectAssets,
+    CLUSTTA_OT_CreateCheckpoints,
+    CLUSTTA_OT_ExportMetrics,
+    CLUSTTA_OT_ResetMetrics,
 ]
 
 
@@ -3,7 +3,7 @@
 import bpy
 from bpy.types import Context, Panel, UILayout
 
-from . import helpers
+from . import batch, blobs, helpers, metrics, push, thumbnails
 
 
 class CLUSTTA_PT_Main(Panel):
@@ -59,25 +59,76 @@ class CLUSTTA_PT_Assets(Panel):
         return bool(context.scene.clustta.active_project)
 
     def draw(self, context: Context) -> None:
+        # Timed inside: Blender rejects a wrapped draw when registering the panel
+        with metrics.timer("CLUSTTA_PT_Assets.draw"):
+            self._draw_assets(context)
+
+    def _draw_assets(self, context: Context) -> None:
         layout = self.layout
         clustta = context.scene.clustta
 
-        # Auto-load assets on first expand
+        # Auto-load assets on first expand (fetched in the background)
         helpers.ensure_assets_loaded(clustta)
 
+        # Search box
+        layout.prop(clustta, "search_query", text="", icon="VIEWZOOM")
+
         # Filter dropdowns + reload button
         row = layout.row(align=True)
         row.prop(clustta, "filter_asset_type", text="")
         row.prop(clustta, "filter_status", text="")
         row.operator("clustta.refresh_assets", icon="FILE_REFRESH", text="")
+        row.prop(clustta, "asset_view", text="", expand=True, icon_only=True)
 
-        # Asset list
+        if helpers.assets_loading(clustta):
+            layout.label(text=f"Loading tasks... ({len(helpers.asset_store)})", icon="SORTTIME")
+
+        # Asset list: the current page of filtered assets
         layout.template_list(
             "CLUSTTA_UL_Assets", "",
             clustta, "assets",
             clustta, "active_asset_index",
             rows=6,
+            type=clustta.asset_view,
+            columns=4,
         )
+        first, last, total = helpers.asset_window_range(clustta)
+        if total > helpers.ASSET_WINDOW_SIZE:
+            row = layout.row(align=True)
+            prev = row.row(align=True)
+            prev.enabled = first > 1
+            prev.operator("clustta.asset_page", icon="TRIA_LEFT", text="").step = -1
+            row.label(text=f"{first}-{last} of {total}")
+            next_ = row.row(align=True)
+            next_.enabled = last < total
+            next_.operator("clustta.asset_page", icon="TRIA_RIGHT", text="").step = 1
+
+        # Batch checkpoints of the ticked tasks
+        progress = batch.current_progress()
+        if batch.is_running():
+            box = layout.box()
+            box.progress(factor=progress.fraction, type="BAR", text=f"Checkpointing {progress.done}/{progress.total}")
+            box.label(text="Esc to skip the rest", icon="INFO")
+            return
+
+        row = layout.row(align=True)
+        row.operator("clustta.select_assets", text="Select All").action = "ALL"
+        selected = helpers.selected_asset_count()
+        if selected:
+            row.operator("clustta.select_assets", text="", icon="X").action = "NONE"
+            box = layout.box()
+            box.prop(clustta, "checkpoint_message", text="Message")
+            box.operator("clustta.create_checkpoints", text=f"Checkpoint {selected} Tasks", icon="CHECKMARK")
+        if progress is not None and progress.failed:
+            col = layout.column(align=True)
+            col.alert = True
+            col.label(text=f"{len(progress.failed)} checkpoint(s) failed:", icon="ERROR")
+            for asset_id, err in list(progress.failed.items())[:5]:
+                row = helpers.asset_store.row_of(asset_id)
+                name = helpers.asset_store.get(row, "name") if row is not None else asset_id
+                col.label(text=f"{name}: {err}")
+            if len(progress.failed) > 5:
+                col.label(text=f"... and {len(progress.failed) - 5} more")
 
 
 class CLUSTTA_PT_Checkpoints(Panel):
@@ -101,7 +152,12 @@ class CLUSTTA_PT_Checkpoints(Panel):
 
         # Header row with count and reload button
         row = layout.row()
-        row.label(text=f"{len(clustta.checkpoints)} checkpoint(s)")
+        asset = clustta.assets[clustta.active_asset_index] if clustta.active_asset_index < len(clustta.assets) else None
+        if asset is not None and helpers.checkpoints_loading(asset.asset_id):
+            row.label(text="Loading checkpoints...", icon="SORTTIME")
+        else:
+            more = "+" if helpers.has_more_checkpoints() else ""
+            row.label(text=f"{len(clustta.checkpoints)}{more} checkpoint(s)")
         row.operator("clustta.refresh_checkpoints", icon="FILE_REFRESH", text="")
 
         # Checkpoint list
@@ -111,22 +167,89 @@ class CLUSTTA_PT_Checkpoints(Panel):
             clustta, "active_checkpoint_index",
             rows=4,
         )
+        if helpers.has_more_checkpoints():
+            layout.operator("clustta.load_more_checkpoints", icon="TRIA_DOWN")
+
+        # Open or restore the selected checkpoint
+        if blobs.is_running():
+            progress = blobs.current_progress()
+            layout.progress(factor=progress.fraction, type="BAR", text=f"{progress.phase}... {progress.fraction:.0%}")
+        else:
+            row = layout.row(align=True)
+            row.enabled = clustta.active_checkpoint_index >= 0
+            row.operator("clustta.checkpoint_file", text="Open", icon="FILE_FOLDER").mode = "OPEN"
+            row.operator("clustta.checkpoint_file", text="Restore", icon="LOOP_BACK").mode = "RESTORE"
+
+        # Cache counters for tuning, shown with Preferences > Interface > Developer Extras
+        if context.preferences.view.show_developer_ui:
+            stats = helpers.checkpoint_cache_stats()
+            layout.label(text=f"Cache: {stats['entries']} lists, {stats['hits']} hits, {stats['misses']} misses")
 
         # Create checkpoint
         box = layout.box()
+        progress = push.current_progress()
+        if push.is_running():
+            box.progress(factor=progress.fraction, type="BAR", text=f"{progress.phase}... {progress.fraction:.0%}")
+            return
         box.prop(clustta, "checkpoint_message", text="Message")
         box.operator("clustta.create_checkpoint", icon="CHECKMARK")
 
 
+class CLUSTTA_PT_Debug(Panel):
+    """Request and draw-time metrics, shown with Preferences > Interface > Developer Extras."""
+
+    bl_label = "Performance"
+    bl_idname = "CLUSTTA_PT_Debug"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Clustta"
+    bl_parent_id = "CLUSTTA_PT_Main"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        return context.preferences.view.show_developer_ui
+
+    def draw(self, context: Context) -> None:
+        layout = self.layout
+        data = metrics.snapshot()
+
+        col = layout.column(align=True)
+        col.label(text="Bridge requests", icon="URL")
+        if not data["requests"]:
+            col.label(text="No requests yet")
+        for name, s in data["requests"].items():
+            col.label(text=name)
+            row = col.row()
+            row.label(text=f"{s['count']}x  p50 {s['p50_ms']:.0f} ms  p95 {s['p95_ms']:.0f} ms")
+            row.label(text=f"{s['bytes_received'] / 1024:.0f} KiB  {s['errors']} err  {s['timeouts']} t/o  {s['coalesced']} shared  {s['rejected']} fast-failed")
+
+        col = layout.column(align=True)
+        col.label(text="UI hooks", icon="TIME")
+        for name, h in data["hooks"].items():
+            row = col.row()
+            row.label(text=name)
+            row.label(text=f"{h['count']}x  avg {h['mean_ms']:.2f}  max {h['max_ms']:.1f} ms")
+
+        row = layout.row(align=True)
+        row.operator("clustta.export_metrics", icon="EXPORT")
+        row.operator("clustta.reset_metrics", icon="TRASH", text="")
+
+
 class CLUSTTA_UL_Assets(bpy.types.UIList):
     """UI list for displaying assets with status and file state."""
 
     bl_idname = "CLUSTTA_UL_Assets"
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_property, index):
+        preview = thumbnails.icon_id(context.scene.clustta, item)
         if self.layout_type in {"DEFAULT", "COMPACT"}:
+            layout.prop(item, "selected", text="")
             split = layout.split(factor=0.6)
-            split.label(text=item.name, icon="BLENDER")
+            if preview:
+                split.label(text=item.name, icon_value=preview)
+            else:
+                split.label(text=item.name, icon="BLENDER")
 
             row = split.row(align=True)
             row.alignment = "RIGHT"
@@ -137,25 +260,11 @@ class CLUSTTA_UL_Assets(bpy.types.UIList):
 
         elif self.layout_type == "GRID":
             layout.alignment = "CENTER"
-            layout.label(text="", icon="BLENDER")
-
-    def filter_items(self, context, data, propname):
-        """Filter assets by asset type and status dropdowns."""
-        items = getattr(data, propname)
-        flt_flags = [self.bitflag_filter_item] * len(items)
-        flt_neworder = list(range(len(items)))
-
-        clustta = context.scene.clustta
-        type_filter = clustta.filter_asset_type
-        status_filter = clustta.filter_status
-
-        for i, item in enumerate(items):
-            if type_filter != "ALL" and item.asset_type != type_filter:
-                flt_flags[i] = 0
-            if status_filter != "ALL" and item.status != status_filter:
-                flt_flags[i] = 0
-
-        return flt_flags, flt_neworder
+            if preview:
+                layout.template_icon(icon_value=preview, scale=4.0)
+            else:
+                layout.label(text="", icon="BLENDER")
+            layout.label(text=item.name)
 
 
 class CLUSTTA_UL_Checkpoints(bpy.types.UIList):
@@ -180,6 +289,7 @@ _classes = [
     CLUSTTA_PT_Main,
     CLUSTTA_PT_Assets,
     CLUSTTA_PT_Checkpoints,
+    CLUSTTA_PT_Debug,
 ]
 
 
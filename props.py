@@ -25,23 +25,32 @@ def _get_status_items(self, context):
     return _status_filter_items
 
 
-def update_filter_items(assets):
-    """Rebuild filter enum items from loaded assets."""
+def update_filter_items(asset_store):
+    """Rebuild filter enum items from the types and statuses in the asset store."""
     global _asset_type_filter_items, _status_filter_items
 
-    types = set()
-    statuses = set()
-    for asset in assets:
-        if asset.asset_type:
-            types.add(asset.asset_type)
-        if asset.status:
-            statuses.add(asset.status)
-
     _asset_type_filter_items = [("ALL", "All Asset Types", "")]
-    _asset_type_filter_items += [(t, t.title(), "") for t in sorted(types)]
+    _asset_type_filter_items += [(t, t.title(), "") for t in sorted(asset_store.present("task_type_name")) if t]
 
     _status_filter_items = [("ALL", "All Statuses", "")]
-    _status_filter_items += [(s, s.upper(), "") for s in sorted(statuses)]
+    _status_filter_items += [(s, s.upper(), "") for s in sorted(asset_store.present("status_short_name")) if s]
+
+
+def _on_asset_filter_changed(self, context):
+    """Called when a filter or the search box changes: show the first page of matches."""
+    from . import helpers
+    self.asset_page = 0
+    helpers.refresh_asset_window(self)
+
+
+def _get_asset_selected(self):
+    from . import helpers
+    return helpers.is_asset_selected(self.asset_id)
+
+
+def _set_asset_selected(self, value):
+    from . import helpers
+    helpers.set_asset_selected(self.asset_id, value)
 
 
 class ClusttaAssetItem(PropertyGroup):
@@ -53,6 +62,8 @@ class ClusttaAssetItem(PropertyGroup):
     asset_type: StringProperty(name="Asset Type", default="")  # type: ignore[valid-type]
     status: StringProperty(name="Status", default="")  # type: ignore[valid-type]
     file_state: StringProperty(name="File State", default="")  # type: ignore[valid-type]
+    # Kept by asset id outside the list, so ticks survive paging and reloads
+    selected: BoolProperty(name="Selected", description="Include in batch checkpoints", get=_get_asset_selected, set=_set_asset_selected)  # type: ignore[valid-type]
 
 
 class ClusttaCheckpointItem(PropertyGroup):
@@ -70,8 +81,11 @@ def _on_asset_index_changed(self, context):
     clustta = context.scene.clustta
     if clustta.active_asset_index >= 0 and clustta.active_asset_index < len(clustta.assets):
         asset = clustta.assets[clustta.active_asset_index]
-        helpers.reset_checkpoint_cache()
-        helpers.load_checkpoints(clustta, asset.asset_id)
+        # Reconciling the list can move the selected row without changing the asset
+        if helpers.checkpoints_loaded_for(asset.asset_id):
+            return
+        helpers.request_checkpoints(clustta, asset.asset_id)
+        helpers.prefetch_neighbor_checkpoints(clustta)
 
 
 class ClusttaProperties(PropertyGroup):
@@ -91,6 +105,7 @@ class ClusttaProperties(PropertyGroup):
     # Asset list
     assets: CollectionProperty(type=ClusttaAssetItem)  # type: ignore[valid-type]
     active_asset_index: IntProperty(name="Active Asset", default=-1, update=_on_asset_index_changed)  # type: ignore[valid-type]
+    asset_page: IntProperty(name="Asset Page", default=0, min=0)  # type: ignore[valid-type]
 
     # Checkpoint list
     checkpoints: CollectionProperty(type=ClusttaCheckpointItem)  # type: ignore[valid-type]
@@ -100,8 +115,16 @@ class ClusttaProperties(PropertyGroup):
     checkpoint_message: StringProperty(name="Checkpoint Message", default="")  # type: ignore[valid-type]
 
     # Filters
-    filter_asset_type: EnumProperty(name="Asset Type", items=_get_asset_type_items)  # type: ignore[valid-type]
-    filter_status: EnumProperty(name="Status", items=_get_status_items)  # type: ignore[valid-type]
+    filter_asset_type: EnumProperty(name="Asset Type", items=_get_asset_type_items, update=_on_asset_filter_changed)  # type: ignore[valid-type]
+    filter_status: EnumProperty(name="Status", items=_get_status_items, update=_on_asset_filter_changed)  # type: ignore[valid-type]
+    asset_view: EnumProperty(  # type: ignore[valid-type]
+        name="View",
+        items=[
+            ("DEFAULT", "List", "Show tasks as a list", "LONGDISPLAY", 0),
+            ("GRID", "Thumbnails", "Show tasks as a grid of thumbnails", "IMGDISPLAY", 1),
+        ],
+    )
+    search_query: StringProperty(name="Search", description="Search tasks by name", default="", options={"TEXTEDIT_UPDATE"}, update=_on_asset_filter_changed)  # type: ignore[valid-type]
 
 
 # Registration
@@ -0,0 +1,204 @@
+"""Chunked, deduplicated checkpoint pushes of large files.
+
+Files are split into content-defined chunks, hashed in a thread pool from a
+memory map, and only chunks the bridge does not already hold are uploaded.
+Because chunk boundaries depend on the bytes around them rather than on
+offsets, a save that changes part of a .blend file leaves most chunks intact.
+"""
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from . import api_client, jobs
+
+MIN_CHUNK_SIZE = 512 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+# A boundary is cut where the rolling hash matches on these bits (~2 MiB average chunks)
+BOUNDARY_MASK = (1 << 21) - 1
+WINDOW_SIZE = 64
+SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+HASH_WORKERS = min(8, os.cpu_count() or 2)
+
+_table = None
+_progress = None
+
+
+def _hash_table():
+    """Return the per-byte values of the rolling hash, derived deterministically."""
+    global _table
+    if _table is None:
+        _table = np.array(
+            [int.from_bytes(hashlib.sha256(bytes([b])).digest()[:8], "little") for b in range(256)],
+            dtype=np.uint64,
+        )
+    return _table
+
+
+class PushProgress:
+    """Progress of a checkpoint push, written by the worker and read by the UI."""
+
+    def __init__(self, asset_id):
+        self.asset_id = asset_id
+        self.phase = "Preparing"
+        self.done = 0
+        self.total = 0
+        self.chunks = 0
+        self.uploaded = 0
+        self.error = None
+
+    @property
+    def fraction(self):
+        return self.done / self.total if self.total else 0.0
+
+    def start_phase(self, phase, total):
+        self.phase = phase
+        self.done = 0
+        self.total = total
+
+
+def find_boundaries(buf, size, progress=None):
+    """Return the end offsets of content-defined chunks covering buf[:size].
+
+    Candidate cuts are positions where a windowed additive hash over the
+    previous WINDOW_SIZE bytes matches BOUNDARY_MASK; they are then thinned
+    and padded so every chunk is between MIN_CHUNK_SIZE and MAX_CHUNK_SIZE.
+    """
+    table = _hash_table()
+    candidates = []
+    for start in range(0, size, SCAN_BLOCK_SIZE):
+        # Overlap blocks by one window so hashes spanning the seam are computed
+        lo = max(0, start - WINDOW_SIZE + 1)
+        count = min(size, start + SCAN_BLOCK_SIZE) - lo
+        if count < WINDOW_SIZE:
+            continue
+        data = np.frombuffer(buf, dtype=np.uint8, count=count, offset=lo)
+        sums = np.cumsum(table[data], dtype=np.uint64)
+        window = sums[WINDOW_SIZE - 1:].copy()
+        window[1:] -= sums[:-WINDOW_SIZE]
+        hits = np.flatnonzero((window & BOUNDARY_MASK) == BOUNDARY_MASK)
+        candidates.extend((hits + (lo + WINDOW_SIZE)).tolist())
+        del data, sums, window, hits
+        if progress is not None:
+            progress.done = lo + count
+
+    cuts = []
+    pos = 0
+    for cut in candidates:
+        while cut - pos > MAX_CHUNK_SIZE:
+            pos += MAX_CHUNK_SIZE
+            cuts.append(pos)
+        if cut - pos >= MIN_CHUNK_SIZE:
+            cuts.append(cut)
+            pos = cut
+    while size - pos > MAX_CHUNK_SIZE:
+        pos += MAX_CHUNK_SIZE
+        cuts.append(pos)
+    if size > pos:
+        cuts.append(size)
+    return cuts
+
+
+def hash_chunks(view, cuts, progress=None):
+    """Hash each chunk of a memory view in a thread pool. Returns [(offset, size, sha256)] in file order."""
+    spans = []
+    offset = 0
+    for cut in cuts:
+        spans.append((offset, cut - offset))
+        offset = cut
+
+    digests = [None] * len(spans)
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="clustta-hash") as pool:
+        # hashlib releases the GIL on large buffers, so chunks hash in parallel
+        futures = {
+            pool.submit(lambda o, n: hashlib.sha256(view[o:o + n]).hexdigest(), o, n): i
+            for i, (o, n) in enumerate(spans)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            digests[i] = future.result()
+            if progress is not None:
+                progress.done += spans[i][1]
+
+    return [(o, n, d) for (o, n), d in zip(spans, digests)]
+
+
+def push_checkpoint(project_id, asset_id, message, file_path, progress):
+    """Worker: chunk, hash and upload a file, then create the checkpoint. Returns (data, error)."""
+    client = api_client.get_client()
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return client.create_checkpoint(project_id, asset_id, message, file_path)
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            progress.start_phase("Chunking", size)
+            cuts = find_boundaries(mm, size, progress)
+
+            progress.start_phase("Hashing", size)
+            chunks = hash_chunks(view, cuts, progress)
+            progress.chunks = len(chunks)
+
+            progress.start_phase("Checking", len(chunks))
+            missing, err = client.find_missing_chunks(project_id, sorted({d for _, _, d in chunks}))
+            if err and err.startswith("HTTP 404"):
+                # Bridge without chunk endpoints: it reads and chunks the file itself
+                progress.start_phase("Creating", 1)
+                return client.create_checkpoint(project_id, asset_id, message, file_path)
+            if err:
+                return None, err
+
+            missing = set(missing or [])
+            to_upload = [(o, n, d) for o, n, d in chunks if d in missing]
+            progress.start_phase("Uploading", sum(n for _, n, _ in to_upload))
+            for o, n, d in to_upload:
+                if d not in missing:
+                    continue  # the same chunk appears twice in the file
+                _, err = client.upload_chunk(project_id, d, view[o:o + n])
+                if err:
+                    return None, err
+                missing.discard(d)
+                progress.done += n
+                progress.uploaded += 1
+
+    progress.start_phase("Creating", 1)
+    manifest = [{"hash": d, "size": n} for _, n, d in chunks]
+    return client.create_checkpoint(project_id, asset_id, message, file_path, chunks=manifest)
+
+
+def start(project_id, asset_id, message, file_path, on_done=None):
+    """Push a checkpoint in the background. Returns False if a push is already running."""
+    global _progress
+    if is_running():
+        return False
+    progress = PushProgress(asset_id)
+    _progress = progress
+
+    def finished(result):
+        _, err = result
+        progress.error = err
+        progress.phase = "Failed" if err else "Done"
+        if on_done is not None:
+            on_done(result)
+
+    def run():
+        # Any failure must come back as the error, or the push would look successful
+        try:
+            return push_checkpoint(project_id, asset_id, message, file_path, progress)
+        except Exception as e:
+            return None, str(e) or type(e).__name__
+
+    return jobs.submit(("push", asset_id), run, on_done=finished)
+
+
+def is_running():
+    """Return True while a checkpoint push is in progress."""
+    return _progress is not None and jobs.is_pending(("push", _progress.asset_id))
+
+
+def current_progress():
+    """Return the progress of the running or last push, or None."""
+    return _progress
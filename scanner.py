@@ -0,0 +1,217 @@
+"""Local file-state scanner: detects changes to asset files on disk between bridge refreshes.
+
+Each scan stats every tracked file, grouped by directory so one os.scandir
+call covers a folder, and re-hashes only files whose mtime or size changed.
+Hashes persist on disk, so unchanged files are never hashed twice. A file
+whose content differs from the one the bridge last reported on shows as
+"modified"; a file that disappeared shows as "missing".
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from . import cache, jobs
+
+SCAN_INTERVAL = 5.0
+SCAN_WORKERS = 4
+MAX_HASH_ENTRIES = 100_000
+HASH_FILE_NAME = "file_hashes.json"
+
+_lock = threading.Lock()
+# asset_id -> (path, bridge_state) for the loaded asset list
+_tracked = {}
+# asset_id -> (bridge_state, content digest the bridge state refers to, or None until scanned)
+_baselines = {}
+# asset_id -> state last reported to the UI
+_reported = {}
+# path -> [mtime_ns, size, digest], persisted
+_hashes = None
+_hashes_dirty = False
+
+
+def _hash_file_path():
+    return os.path.join(cache.cache_dir(), HASH_FILE_NAME)
+
+
+def _load_hashes():
+    """Load the persisted hash cache on first use."""
+    global _hashes
+    if _hashes is None:
+        try:
+            with open(_hash_file_path(), "rb") as f:
+                _hashes = json.loads(f.read())
+        except (OSError, ValueError):
+            _hashes = {}
+    return _hashes
+
+
+def _save_hashes():
+    """Write the hash cache back to disk if it changed."""
+    global _hashes_dirty
+    if not _hashes_dirty:
+        return
+    with _lock:
+        # Keep the most recently inserted entries if the cache outgrew its limit
+        while len(_hashes) > MAX_HASH_ENTRIES:
+            del _hashes[next(iter(_hashes))]
+        payload = json.dumps(_hashes).encode("utf-8")
+        _hashes_dirty = False
+    path = _hash_file_path()
+    try:
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(payload)
+        os.replace(f"{path}.tmp", path)
+    except OSError:
+        pass
+
+
+def _track_one(asset_id, path, state):
+    """Track or retrack one asset's file. Caller holds the lock."""
+    _tracked[asset_id] = (path, state)
+    baseline = _baselines.get(asset_id)
+    if baseline is None or baseline[0] != state:
+        _baselines[asset_id] = (state, None)
+
+
+def track(assets):
+    """Track the files of a freshly loaded asset list: an iterable of (asset_id, path, bridge_state).
+
+    Baselines are kept for assets whose bridge state did not change, so a local
+    edit the bridge has not noticed yet stays marked as modified.
+    """
+    with _lock:
+        _tracked.clear()
+        for asset_id, path, state in assets:
+            _track_one(asset_id, path, state)
+        for asset_id in list(_baselines):
+            if asset_id not in _tracked:
+                del _baselines[asset_id]
+        _reported.clear()
+
+
+def update(assets):
+    """Track changed or added assets, as (asset_id, path, bridge_state), leaving the others as they are."""
+    with _lock:
+        for asset_id, path, state in assets:
+            _track_one(asset_id, path, state)
+            _reported.pop(asset_id, None)
+
+
+def forget(asset_ids):
+    """Stop tracking removed assets."""
+    with _lock:
+        for asset_id in asset_ids:
+            _tracked.pop(asset_id, None)
+            _baselines.pop(asset_id, None)
+            _reported.pop(asset_id, None)
+
+
+def _stat_directory(directory, names):
+    """Return {name: (mtime_ns, size)} for the wanted names in one directory."""
+    found = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name in names and entry.is_file():
+                    st = entry.stat()
+                    found[entry.name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return found
+
+
+def _hash_file(path):
+    """Return the BLAKE2b digest of a file, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=20)).hexdigest()
+    except OSError:
+        return None
+
+
+def scan():
+    """Worker: scan tracked files and return {asset_id: file_state} for states that changed."""
+    global _hashes_dirty
+    with _lock:
+        tracked = dict(_tracked)
+    hashes = _load_hashes()
+
+    # directory -> {file name: tracked paths}; stats are keyed by the tracked path as written,
+    # since joining the name back on may change its separators (e.g. on Windows)
+    by_dir = {}
+    for path, _ in tracked.values():
+        if path:
+            names = by_dir.setdefault(os.path.dirname(path), {})
+            names.setdefault(os.path.basename(path), set()).add(path)
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="clustta-scan") as pool:
+        stats = {}
+        for directory, found in zip(by_dir, pool.map(lambda d: _stat_directory(d, by_dir[d]), by_dir)):
+            for name, st in found.items():
+                for path in by_dir[directory][name]:
+                    stats[path] = st
+
+        # Only files that are new or whose mtime/size changed get hashed
+        stale = [p for p, (mtime, size) in stats.items() if hashes.get(p, [None, None])[:2] != [mtime, size]]
+        for path, digest in zip(stale, pool.map(_hash_file, stale)):
+            if digest is not None:
+                with _lock:
+                    hashes[path] = [stats[path][0], stats[path][1], digest]
+                    _hashes_dirty = True
+
+    changes = {}
+    with _lock:
+        for asset_id, (path, bridge_state) in tracked.items():
+            if not path:
+                continue
+            if path not in stats:
+                state = "missing"
+            else:
+                entry = hashes.get(path)
+                digest = entry[2] if entry else None
+                baseline_state, baseline_digest = _baselines.get(asset_id, (bridge_state, None))
+                if baseline_digest is None:
+                    _baselines[asset_id] = (baseline_state, digest)
+                    baseline_digest = digest
+                if bridge_state == "missing":
+                    # The bridge expected no local file; one has appeared since
+                    state = "modified"
+                else:
+                    state = "modified" if digest != baseline_digest else bridge_state
+            if _reported.get(asset_id, bridge_state) != state:
+                changes[asset_id] = state
+            _reported[asset_id] = state
+
+    _save_hashes()
+    return changes
+
+
+def _apply_changes(changes):
+    """Main thread: write scanned file states into the asset store and list."""
+    if not changes:
+        return
+    from . import helpers
+    helpers.apply_file_states(changes)
+
+
+def _scan_tick():
+    """Timer callback: start a background scan unless one is running."""
+    if _tracked:
+        jobs.submit(("scan",), scan, on_done=_apply_changes)
+    return SCAN_INTERVAL
+
+
+def register():
+    if not bpy.app.timers.is_registered(_scan_tick):
+        bpy.app.timers.register(_scan_tick, first_interval=SCAN_INTERVAL, persistent=True)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(_scan_tick):
+        bpy.app.timers.unregister(_scan_tick)
+    _save_hashes()
@@ -0,0 +1,164 @@
+"""Minimal stand-in for Blender's bpy module, enough to import and drive the addon outside Blender.
+
+Property declarations become plain attributes with their defaults, collection
+properties become lists with add/remove/move/clear, and timers are only
+recorded: benchmarks call the addon's tick functions themselves. Property
+update callbacks are not fired.
+"""
+
+import os
+import sys
+import tempfile
+import types
+
+
+class _Prop:
+    """A property declaration, as returned by the bpy.props functions."""
+
+    def __init__(self, kind, **options):
+        self.kind = kind
+        self.options = options
+
+    def make_value(self):
+        if self.kind == "Collection":
+            return Collection(self.options.get("type"))
+        if self.kind == "Pointer":
+            return self.options["type"]()
+        if self.kind == "Enum":
+            return "ALL"
+        default = self.options.get("default")
+        if default is None:
+            default = {"Bool": False, "Int": 0, "Float": 0.0, "String": ""}.get(self.kind)
+        return default
+
+
+def _prop_factory(kind):
+    return lambda **options: _Prop(kind, **options)
+
+
+class _Struct:
+    """Base of PropertyGroup, Panel, Operator and UIList: fills declared properties with defaults."""
+
+    def __init__(self):
+        for cls in reversed(type(self).__mro__):
+            for name, decl in getattr(cls, "__annotations__", {}).items():
+                if isinstance(decl, _Prop):
+                    setattr(self, name, decl.make_value())
+
+
+class Collection(list):
+    """Stand-in for a CollectionProperty value."""
+
+    def __init__(self, item_type=None):
+        super().__init__()
+        self.item_type = item_type or _Struct
+
+    def add(self):
+        item = self.item_type()
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def move(self, src, dst):
+        self.insert(dst, self.pop(src))
+
+
+class _Preview:
+    def __init__(self, icon_id):
+        self.icon_id = icon_id
+
+
+class _PreviewCollection(dict):
+    """Stand-in for a bpy.utils.previews collection; images are not read."""
+
+    _next_icon_id = 1
+
+    def load(self, name, path, path_type, force_reload=False):
+        if name in self:
+            raise KeyError(f"key {name!r} already exists")
+        preview = self[name] = _Preview(_PreviewCollection._next_icon_id)
+        _PreviewCollection._next_icon_id += 1
+        return preview
+
+
+class _Timers:
+    def __init__(self):
+        self.registered = {}
+
+    def register(self, fn, first_interval=0, persistent=False):
+        self.registered[fn] = first_interval
+
+    def unregister(self, fn):
+        del self.registered[fn]
+
+    def is_registered(self, fn):
+        return fn in self.registered
+
+
+def install(cache_dir=None):
+    """Put the shim into sys.modules as bpy and bpy_extras. Returns the bpy module."""
+    if "bpy" in sys.modules:
+        return sys.modules["bpy"]
+    cache_dir = cache_dir or tempfile.mkdtemp(prefix="clustta-bench-")
+
+    bpy = types.ModuleType("bpy")
+    bpy.props = types.ModuleType("bpy.props")
+    for kind in ("Bool", "Int", "Float", "String", "Enum", "Collection", "Pointer"):
+        setattr(bpy.props, f"{kind}Property", _prop_factory(kind))
+
+    bpy.types = types.ModuleType("bpy.types")
+    for name in ("PropertyGroup", "Panel", "Operator", "UIList", "Menu"):
+        setattr(bpy.types, name, type(name, (_Struct,), {}))
+    bpy.types.Context = object
+    bpy.types.UILayout = object
+    bpy.types.Scene = type("Scene", (_Struct,), {})
+
+    handlers = types.ModuleType("bpy.app.handlers")
+    handlers.load_post = []
+    handlers.save_post = []
+    handlers.persistent = lambda fn: fn
+    bpy.app = types.SimpleNamespace(
+        timers=_Timers(),
+        version=(4, 3, 0),
+        version_string="4.3.0 (bpy shim)",
+        background=True,
+        handlers=handlers,
+    )
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = lambda cls: None
+    bpy.utils.unregister_class = lambda cls: None
+    bpy.utils.extension_path_user = lambda package, path="", create=False: os.path.join(cache_dir, path)
+    bpy.utils.user_resource = lambda kind, path="", create=False: os.path.join(cache_dir, path)
+    bpy.utils.previews = types.ModuleType("bpy.utils.previews")
+    bpy.utils.previews.new = _PreviewCollection
+    bpy.utils.previews.remove = lambda collection: collection.clear()
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+    bpy.context = types.SimpleNamespace(
+        scene=None,
+        window_manager=types.SimpleNamespace(windows=[]),
+        preferences=types.SimpleNamespace(view=types.SimpleNamespace(show_developer_ui=True)),
+    )
+
+    bpy_extras = types.ModuleType("bpy_extras")
+    bpy_extras.io_utils = types.ModuleType("bpy_extras.io_utils")
+    bpy_extras.io_utils.ExportHelper = type("ExportHelper", (), {})
+
+    for name, module in (("bpy", bpy), ("bpy.props", bpy.props), ("bpy.types", bpy.types), ("bpy.app.handlers", handlers),
+                         ("bpy.utils", bpy.utils), ("bpy.utils.previews", bpy.utils.previews),
+                         ("bpy_extras", bpy_extras), ("bpy_extras.io_utils", bpy_extras.io_utils)):
+        sys.modules[name] = module
+    os.makedirs(os.path.join(cache_dir, "cache"), exist_ok=True)
+    return bpy
+
+
+def new_scene():
+    """Create a scene with the properties the addon registered on bpy.types.Scene and make it current."""
+    bpy = sys.modules["bpy"]
+    scene = bpy.types.Scene()
+    for name, decl in vars(bpy.types.Scene).items():
+        if isinstance(decl, _Prop):
+            setattr(scene, name, decl.make_value())
+    bpy.context.scene = scene
+    return scene
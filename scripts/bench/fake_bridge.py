@@ -0,0 +1,302 @@
+"""Local stand-in for the Clustta Bridge, serving synthetic projects for benchmarks.
+
+Usage:
+    python scripts/bench/fake_bridge.py --port 1173 --sizes 100,10000 --latency-ms 5
+
+Serves /health, /session, /accounts, /studios, /projects (with /active and
+/switch), paged /assets and paged /assets/{id}/checkpoints with ETag
+revalidation, gzip and msgpack negotiation, the chunk endpoints used by checkpoint pushes and
+downloads and, when enabled, a long-poll /events feed. Each project holds
+the given number of generated assets; data is deterministic for a given seed.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+TASK_TYPES = ("modeling", "rigging", "texturing", "animation", "layout", "lighting", "fx")
+STATUSES = ("todo", "wip", "review", "retake", "done")
+FILE_STATES = ("normal", "normal", "normal", "outdated", "modified", "missing", "rebuildable")
+WORDS = (
+    "hero", "villain", "tree", "rock", "house", "car", "bridge", "forest", "city", "robot",
+    "dragon", "ship", "castle", "lamp", "chair", "table", "street", "market", "tower", "river",
+)
+CHECKPOINTS_PER_ASSET = 120
+DEFAULT_PAGE_SIZE = 2000
+
+
+def make_assets(count, seed=0):
+    """Return count synthetic bridge assets."""
+    rng = random.Random(seed * 1_000_003 + count)
+    assets = []
+    for i in range(count):
+        name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{rng.choice(TASK_TYPES)}_{i:06d}"
+        assets.append({
+            "id": f"asset-{count}-{i}",
+            "name": name,
+            "file_path": f"//assets/{name}.blend",
+            "task_type_name": rng.choice(TASK_TYPES),
+            "status_short_name": rng.choice(STATUSES),
+            "file_status": rng.choice(FILE_STATES),
+        })
+    return assets
+
+
+def make_checkpoints(asset_id, count=CHECKPOINTS_PER_ASSET):
+    """Return the synthetic checkpoint history of an asset, newest first."""
+    return [
+        {
+            "id": f"{asset_id}-cp{n}",
+            "comment": f"Checkpoint {n}",
+            "created_at": f"2026-01-{1 + n % 28:02d}T12:00:00Z",
+            "author_id": "bench",
+        }
+        for n in range(count, 0, -1)
+    ]
+
+
+class FakeBridge:
+    """Threaded HTTP server emulating the bridge API.
+
+    latency is added to every request, in seconds. Without session or events
+    the matching endpoints answer 404, like older bridges; without msgpack
+    every response is JSON whatever the client accepts.
+    """
+
+    def __init__(self, port=0, sizes=(100,), latency=0.0, session=True, events=False, seed=0, msgpack=True):
+        self.latency = latency
+        self.msgpack = msgpack
+        self.session = session
+        self.events = events
+        self.requests = 0
+        self.accounts = [{"id": "acc-1", "email": "bench@example.com", "first_name": "Bench", "last_name": "User"}]
+        self.studios = [{"id": "studio-1", "name": "Bench Studio"}]
+        self.projects = [{"uri": f"bench://project-{n}", "name": f"Project {n}"} for n in sizes]
+        self.assets = {p["uri"]: make_assets(n, seed) for p, n in zip(self.projects, sizes)}
+        self.active_project = self.projects[0]["uri"] if self.projects else ""
+        self.chunks = {}
+        self.checkpoints = {}
+        self.event_log = []
+        self._events_changed = threading.Condition()
+
+        class Handler(_Handler):
+            bridge = self
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-bridge", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._events_changed:
+            self.events = False
+            self._events_changed.notify_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def use_project(self, size):
+        """Make the project with this many assets active. Returns its URI."""
+        self.active_project = f"bench://project-{size}"
+        return self.active_project
+
+    def publish(self, event):
+        """Append a change event for /events subscribers."""
+        with self._events_changed:
+            self.event_log.append(event)
+            self._events_changed.notify_all()
+
+    def wait_events(self, cursor, wait):
+        """Block until there are events after cursor or wait seconds pass. Returns (cursor, events)."""
+        with self._events_changed:
+            if cursor >= 0:
+                self._events_changed.wait_for(lambda: len(self.event_log) > cursor or not self.events, timeout=wait)
+                return len(self.event_log), self.event_log[cursor:]
+            return len(self.event_log), []
+
+    # Responses
+
+    def route(self, method, path, query, body):
+        """Return (status, data) for a request."""
+        parts = [unquote(p) for p in path.strip("/").split("/") if p]
+        active = next((p for p in self.projects if p["uri"] == self.active_project), None)
+        if method == "GET":
+            if parts == ["health"]:
+                return 200, {"status": "ok"}
+            if parts == ["session"]:
+                if not self.session:
+                    return 404, None
+                return 200, {
+                    "accounts": self.accounts, "studios": self.studios, "projects": self.projects,
+                    "active_account": self.accounts[0], "active_studio": self.studios[0], "active_project": active,
+                }
+            if parts == ["accounts"]:
+                return 200, self.accounts
+            if parts == ["accounts", "active"]:
+                return 200, self.accounts[0]
+            if parts == ["studios"]:
+                return 200, self.studios
+            if parts == ["studios", "active"]:
+                return 200, self.studios[0]
+            if parts == ["projects"]:
+                return 200, self.projects
+            if parts == ["projects", "active"]:
+                return 200, active
+            if len(parts) == 3 and parts[0] == "studios" and parts[2] == "projects":
+                return 200, self.projects
+            if parts == ["assets"] or (len(parts) == 3 and parts[0] == "projects" and parts[2] == "assets"):
+                assets = self.assets.get(self.active_project if parts == ["assets"] else parts[1], [])
+                if "offset" not in query:
+                    return 200, assets
+                offset = int(query["offset"])
+                limit = int(query.get("limit", DEFAULT_PAGE_SIZE))
+                end = offset + limit
+                return 200, {"assets": assets[offset:end], "next_offset": end if end < len(assets) else None}
+            if len(parts) == 3 and parts[0] == "assets" and parts[2] == "checkpoints":
+                checkpoints = make_checkpoints(parts[1])
+                if "offset" not in query:
+                    return 200, checkpoints
+                offset = int(query["offset"])
+                end = offset + int(query.get("limit", 50))
+                return 200, {"checkpoints": checkpoints[offset:end], "next_offset": end if end < len(checkpoints) else None}
+            if len(parts) == 7 and parts[0] == "projects" and parts[4] == "checkpoints" and parts[6] == "chunks":
+                manifest = self.checkpoints.get(parts[5])
+                return (200, {"chunks": manifest}) if manifest is not None else (404, None)
+            if len(parts) == 4 and parts[0] == "projects" and parts[2] == "chunks" and parts[3] in self.chunks:
+                return 200, self.chunks[parts[3]]
+            if parts == ["events"]:
+                if not self.events:
+                    return 404, None
+                cursor, events = self.wait_events(int(query.get("cursor") or -1), float(query.get("wait", 0)))
+                return 200, {"cursor": str(cursor), "events": events}
+        elif method == "POST":
+            if parts in (["accounts", "switch"], ["studios", "switch"]):
+                return 200, {"ok": True}
+            if parts == ["projects", "switch"]:
+                self.active_project = (body or {}).get("uri", "")
+                return 200, {"ok": True}
+            if len(parts) == 4 and parts[0] == "projects" and parts[2:] == ["chunks", "missing"]:
+                return 200, {"missing": [h for h in (body or {}).get("hashes", []) if h not in self.chunks]}
+            if len(parts) == 5 and parts[0] == "projects" and parts[4] == "checkpoints":
+                checkpoint_id = f"{parts[3]}-{len(self.checkpoints) + 1}"
+                if (body or {}).get("chunks") is not None:
+                    self.checkpoints[checkpoint_id] = body["chunks"]
+                return 200, {"id": checkpoint_id}
+        elif method == "PUT":
+            if len(parts) == 4 and parts[0] == "projects" and parts[2] == "chunks":
+                self.chunks[parts[3]] = body
+                return 200, None
+        return 404, None
+
+    def encode(self, data, accept=""):
+        """Return (body, content type, ETag) for response data.
+
+        Bytes are sent as they are; other data as msgpack if the client accepts
+        it, msgpack is installed and the bridge is not JSON-only, otherwise JSON.
+        """
+        if isinstance(data, bytes):
+            raw, content_type = data, "application/octet-stream"
+        elif self.msgpack and msgpack is not None and "application/msgpack" in accept:
+            raw, content_type = msgpack.packb(data), "application/msgpack"
+        else:
+            raw, content_type = json.dumps(data).encode("utf-8"), "application/json"
+        return raw, content_type, '"' + hashlib.blake2b(raw, digest_size=12).hexdigest() + '"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs add ~40 ms per request
+    disable_nagle_algorithm = True
+    bridge = None
+
+    def _handle(self, method):
+        bridge = self.bridge
+        bridge.requests += 1
+        if bridge.latency:
+            time.sleep(bridge.latency)
+
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = self.rfile.read(length) if length else b""
+        body = None
+        if payload and self.headers.get("Content-Type") == "application/json":
+            body = json.loads(payload)
+        elif payload:
+            body = payload
+
+        status, data = bridge.route(method, url.path, query, body)
+        if status != 200:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        raw, content_type, etag = bridge.encode(data, self.headers.get("Accept", ""))
+        if method == "GET" and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if method == "GET":
+            self.send_header("ETag", etag)
+        if len(raw) > 1024 and not isinstance(data, bytes) and "gzip" in self.headers.get("Accept-Encoding", ""):
+            raw = gzip.compress(raw, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a stand-in Clustta Bridge with synthetic projects")
+    parser.add_argument("--port", type=int, default=1173)
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="comma-separated asset counts, one project each")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every request")
+    parser.add_argument("--no-session", action="store_true", help="answer /session with 404 like older bridges")
+    parser.add_argument("--events", action="store_true", help="serve the /events long-poll feed")
+    parser.add_argument("--json-only", action="store_true", help="answer in JSON even to clients accepting msgpack")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    bridge = FakeBridge(args.port, sizes, args.latency_ms / 1000.0, not args.no_session, args.events, msgpack=not args.json_only).start()
+    print(f"Fake bridge on http://127.0.0.1:{bridge.port} with projects of {', '.join(map(str, sizes))} assets")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        bridge.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""Benchmark the addon against a local stand-in bridge and store the results as JSON.
+
+Usage:
+    python scripts/bench/run.py [--sizes 100,1000,10000,100000] [--latency-ms 0,5]
+                                [--output bench_results.json] [--baseline old.json]
+    blender -b --factory-startup --python scripts/bench/run.py -- [options]
+
+Outside Blender a bpy shim is installed. Measures BridgeClient request
+throughput and asset page downloads (msgpack and JSON), decoding asset
+lists as JSON and as msgpack, load_assets (cold and unchanged) with
+the asset store's memory, streamed loading, filtering the asset list window,
+_sync_active_state, and writing a checkpoint's file from the bridge and from
+the local blob cache.
+The addon caches to a temporary directory, also inside Blender, so the
+user's caches are left alone.
+With --baseline, results slower than the baseline by more than --tolerance
+are reported and the script exits with status 1.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_bridge  # noqa: E402
+
+try:
+    import bpy  # noqa: F401
+    IN_BLENDER = True
+except ImportError:
+    import bpy_shim
+    bpy_shim.install()
+    IN_BLENDER = False
+
+
+# Size of the file checkpointed by bench_checkpoint_file (MiB)
+CHECKPOINT_FILE_MB = 64
+
+
+def load_addon(cache_dir):
+    """Import the addon from the source tree as the "clustta" package and register it, caching under cache_dir.
+
+    Returns the addon and the cache directory it used before.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "clustta", os.path.join(ADDON_DIR, "__init__.py"), submodule_search_locations=[ADDON_DIR]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules["clustta"] = addon
+    spec.loader.exec_module(addon)
+    # Benchmarks clear the caches, so never point them at the user's, even inside Blender
+    cache = sys.modules["clustta.cache"]
+    previous_cache_dir, cache._cache_dir = cache._cache_dir, cache_dir
+    addon.register()
+    return addon, previous_cache_dir
+
+
+def measure(fn, repeat, setup=None):
+    """Time fn() repeat times, calling setup() untimed before each run. Returns summary statistics."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "max_s": max(times),
+        "runs": repeat,
+    }
+
+
+class Bench:
+    def __init__(self, addon, bridge, repeat):
+        self.addon = addon
+        self.bridge = bridge
+        self.repeat = repeat
+        self.results = []
+        self.api_client = sys.modules["clustta.api_client"]
+        self.helpers = sys.modules["clustta.helpers"]
+        self.jobs = sys.modules["clustta.jobs"]
+        self.operators = sys.modules["clustta.operators"]
+        self.search = sys.modules["clustta.search"]
+        self.clustta = self._scene().clustta
+
+    def _scene(self):
+        if IN_BLENDER:
+            return bpy.context.scene
+        return bpy_shim.new_scene()
+
+    def new_client(self, binary=True):
+        """Point the addon at the fake bridge with a fresh client (empty pool and validators)."""
+        self.api_client.close_client()
+        self.api_client._instance = self.api_client.BridgeClient(port=self.bridge.port, binary=binary)
+        return self.api_client._instance
+
+    def record(self, name, size, stats, **extra):
+        entry = {"name": name, "size": size, "latency_ms": self.bridge.latency * 1000.0, **stats, **extra}
+        self.results.append(entry)
+        print(f"  {name:<32} {size:>7}  median {entry['median_s'] * 1000:9.2f} ms  min {entry['min_s'] * 1000:9.2f} ms")
+
+    def reset_assets(self):
+        """Forget loaded assets so the next load starts from an empty list."""
+        self.helpers.reset_asset_cache()
+        self.helpers.reset_checkpoint_cache()
+        self.helpers.clear_assets(self.clustta)
+        self.search.invalidate_index()
+
+    def wait_for_jobs(self):
+        """Deliver background jobs until none are left, as the timer would."""
+        while self.jobs._pending:
+            time.sleep(self.jobs.POLL_INTERVAL)
+            self.jobs._drain()
+
+    def select_project(self, size):
+        self.clustta.active_project_id = self.bridge.use_project(size)
+
+    def store_bytes(self):
+        """Return the memory an asset store of the project takes, besides the strings it shares with the response."""
+        assets, _ = self.helpers._fetch_all_assets(self.api_client.get_client())
+        tracemalloc.start()
+        store = type(self.helpers.asset_store)()
+        for a in assets:
+            store.upsert(a)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+    # Benchmarks
+
+    def bench_client(self, size):
+        client = self.new_client()
+        count = 200
+
+        def sequential():
+            for _ in range(count):
+                client.health_check()
+
+        def concurrent():
+            with ThreadPoolExecutor(max_workers=self.jobs.MAX_WORKERS) as pool:
+                list(pool.map(lambda _: client.health_check(), range(count)))
+
+        stats = measure(sequential, self.repeat)
+        self.record("client.health_sequential", size, stats, requests_per_s=count / stats["median_s"])
+        stats = measure(concurrent, self.repeat)
+        self.record("client.health_concurrent", size, stats, requests_per_s=count / stats["median_s"])
+
+        def fetch_pages():
+            self.helpers._fetch_all_assets(self.api_client.get_client())
+
+        stats = measure(fetch_pages, self.repeat, setup=self.new_client)
+        self.record("client.asset_pages", size, stats)
+        stats = measure(fetch_pages, self.repeat, setup=lambda: self.new_client(binary=False))
+        self.record("client.asset_pages_json", size, stats)
+        self.new_client()
+        fetch_pages()
+        stats = measure(fetch_pages, self.repeat)
+        self.record("client.asset_pages_revalidate", size, stats)
+
+    def bench_decode(self, size):
+        """Decode an asset list response body as JSON and as msgpack, without the network."""
+        payload = {"assets": fake_bridge.make_assets(size), "next_offset": None}
+        bodies = [("json", "application/json", json.dumps(payload).encode("utf-8"))]
+        msgpack = self.api_client.msgpack
+        if msgpack is not None:
+            bodies.append(("msgpack", "application/msgpack", msgpack.packb(payload)))
+        else:
+            print("  decode.msgpack skipped: msgpack is not installed")
+        for name, content_type, body in bodies:
+            stats = measure(lambda: self.api_client.decode_body(content_type, body), self.repeat)
+            self.record(
+                f"decode.{name}", size, stats, body_bytes=len(body),
+                mb_per_s=len(body) / stats["median_s"] / 1e6, rows_per_s=size / stats["median_s"],
+            )
+
+    def bench_load_assets(self, size):
+        self.new_client()
+        stats = measure(lambda: self.helpers.load_assets(self.clustta), self.repeat, setup=self.reset_assets)
+        self.record("load_assets.cold", size, stats, store_bytes=self.store_bytes())
+        stats = measure(lambda: self.helpers.load_assets(self.clustta), self.repeat)
+        self.record("load_assets.unchanged", size, stats)
+
+    def bench_stream(self, size):
+        """Stream assets as request_assets does, calling the timer callbacks directly."""
+        self.new_client()
+        first_rows = []
+
+        def stream():
+            start = time.perf_counter()
+            self.helpers.request_assets(self.clustta, use_cache=False)
+            while self.helpers.assets_loading(self.clustta):
+                self.helpers._ingest_tick()
+                if not first_rows and len(self.clustta.assets):
+                    first_rows.append(time.perf_counter() - start)
+                time.sleep(self.helpers.INGEST_INTERVAL)
+            self.jobs._drain()
+
+        def setup():
+            self.reset_assets()
+            first_rows.clear()
+
+        stats = measure(stream, self.repeat, setup=setup)
+        self.record("stream_assets.total", size, stats, first_rows_s=first_rows[0] if first_rows else None)
+
+    def bench_asset_window(self, size):
+        self.new_client()
+        self.reset_assets()
+        self.helpers.load_assets(self.clustta)
+        # The search index is built on a worker
+        self.wait_for_jobs()
+        store = self.helpers.asset_store
+        index = self.search.get_index()
+        stats = measure(lambda: self.search.NameIndex(store.names()), self.repeat)
+        self.record("search_index.build", size, stats)
+        types = [t for t in store.present("task_type_name") if t]
+        statuses = [s for s in store.present("status_short_name") if s]
+
+        cases = (
+            ("asset_window.none", "ALL", "ALL", ""),
+            ("asset_window.type_status", types[0] if types else "ALL", statuses[0] if statuses else "ALL", ""),
+            ("asset_window.search_short", "ALL", "ALL", "he"),
+            ("asset_window.search_substring", "ALL", "ALL", "ee"),
+            ("asset_window.search_word", "ALL", "ALL", "dragon"),
+            ("asset_window.search_typo", "ALL", "ALL", "dragno_castle"),
+        )
+        for name, asset_type, status, query in cases:
+            self.clustta.filter_asset_type = asset_type
+            self.clustta.filter_status = status
+            self.clustta.search_query = query
+            self.clustta.asset_page = 0
+
+            def cold():
+                store._masks = None
+                self.helpers._filtered = (None, [])
+                index._cache.clear()
+
+            stats = measure(lambda: self.helpers.refresh_asset_window(self.clustta), self.repeat, setup=cold)
+            self.record(name + ".cold", size, stats)
+            stats = measure(lambda: self.helpers.refresh_asset_window(self.clustta), self.repeat)
+            self.record(name + ".cached", size, stats)
+        self.clustta.filter_asset_type = "ALL"
+        self.clustta.filter_status = "ALL"
+        self.clustta.search_query = ""
+
+    def bench_sync_active_state(self, size):
+        for session in (True, False):
+            self.bridge.session = session
+            client = self.new_client()
+            stats = measure(lambda: self.operators._sync_active_state(self.clustta, client), self.repeat)
+            self.record("sync_active_state.session" if session else "sync_active_state.separate", size, stats)
+        self.bridge.session = True
+
+    def bench_checkpoint_file(self):
+        """Push a checkpoint, then write its file back from the bridge and from the blob cache."""
+        push = sys.modules["clustta.push"]
+        blobs = sys.modules["clustta.blobs"]
+        self.new_client()
+        project_id = self.bridge.active_project
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "asset.blend")
+            with open(path, "wb") as f:
+                f.write(random.Random(0).randbytes(CHECKPOINT_FILE_MB * 1024 * 1024))
+            data, err = push.push_checkpoint(project_id, "asset-bench", "bench", path, push.PushProgress("asset-bench"))
+            if err:
+                print(f"  checkpoint push failed: {err}")
+                return
+            dest = os.path.join(tmp, "restored.blend")
+
+            def fetch():
+                blobs.materialize(project_id, "asset-bench", data["id"], dest)
+
+            stats = measure(fetch, self.repeat, setup=blobs.clear)
+            self.record("checkpoint_file.cold", CHECKPOINT_FILE_MB, stats)
+            stats = measure(fetch, self.repeat)
+            self.record("checkpoint_file.cached", CHECKPOINT_FILE_MB, stats)
+
+    def run(self, sizes):
+        for size in sizes:
+            self.select_project(size)
+            print(f"Project with {size} assets, {self.bridge.latency * 1000:.0f} ms latency")
+            self.bench_client(size)
+            self.bench_decode(size)
+            self.bench_load_assets(size)
+            self.bench_stream(size)
+            self.bench_asset_window(size)
+            self.bench_sync_active_state(size)
+            self.reset_assets()
+        self.bench_checkpoint_file()
+
+
+def compare(results, baseline_path, tolerance):
+    """Return descriptions of results slower than the baseline by more than tolerance."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["name"], r["size"], r["latency_ms"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        old = baseline.get((r["name"], r["size"], r["latency_ms"]))
+        if old and r["median_s"] > old["median_s"] * (1 + tolerance):
+            regressions.append(
+                f"{r['name']} ({r['size']} assets, {r['latency_ms']:.0f} ms): "
+                f"{old['median_s'] * 1000:.2f} -> {r['median_s'] * 1000:.2f} ms"
+            )
+    return regressions
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(description="Benchmark the Clustta addon against a stand-in bridge")
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="comma-separated asset counts")
+    parser.add_argument("--latency-ms", default="0", help="comma-separated bridge latencies to run with")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    latencies = [float(ms) / 1000.0 for ms in args.latency_ms.split(",") if ms]
+
+    cache_dir = tempfile.mkdtemp(prefix="clustta-bench-cache-")
+    addon, previous_cache_dir = load_addon(cache_dir)
+    bridge = fake_bridge.FakeBridge(sizes=sizes).start()
+    bench = Bench(addon, bridge, args.repeat)
+    try:
+        for latency in latencies:
+            bridge.latency = latency
+            bench.run(sizes)
+    finally:
+        bridge.stop()
+        addon.unregister()
+        sys.modules["clustta.cache"]._cache_dir = previous_cache_dir
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    data = {
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "blender": bpy.app.version_string if IN_BLENDER else None,
+        "repeat": args.repeat,
+        "results": bench.results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results: {args.output}")
+
+    if args.baseline:
+        regressions = compare(bench.results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
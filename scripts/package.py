@@ -23,10 +23,24 @@ DIST_DIR = os.path.join(ADDON_DIR, "dist")
 INCLUDE_FILES = [
     "__init__.py",
     "api_client.py",
+    "batch.py",
+    "blobs.py",
+    "cache.py",
+    "connection.py",
+    "events.py",
     "helpers.py",
+    "jobs.py",
+    "metrics.py",
     "operators.py",
     "panels.py",
     "props.py",
+    "push.py",
+    "scanner.py",
+    "search.py",
+    "selector_cache.py",
+    "session.py",
+    "store.py",
+    "thumbnails.py",
     "blender_manifest.toml",
     "LICENSE",
 ]
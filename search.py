@@ -0,0 +1,271 @@
+"""Prebuilt index over asset names for fast, ranked fuzzy search."""
+
+import re
+from bisect import insort
+from collections import Counter, OrderedDict
+from itertools import chain, compress, islice, repeat
+from operator import contains
+
+# Fuzzy matches must share at least this fraction of the query's trigrams
+MIN_FUZZY_SIMILARITY = 0.5
+MAX_CACHED_QUERIES = 32
+# Rows ranked at a time while a result is iterated
+RANK_CHUNK = 256
+
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+_WORD_PREFIX = re.compile(r"[0-9a-z]{1,2}")
+
+_index = None
+
+
+def _trigrams(text):
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _grams(text):
+    """Return the set of 1- to 3-character substrings of text."""
+    return {text[i:i + size] for size in (1, 2, 3) for i in range(len(text) - size + 1)}
+
+
+class Matches:
+    """Rows of a search, best match first, ranked only as far as they are read.
+
+    Slicing the first page of a large result ranks just that page; len()
+    counts the matches without ranking them and is remembered.
+    """
+
+    def __init__(self, ranked, hits, count=None):
+        # ranked yields the rows in order; hits() returns the same rows in any order,
+        # and count(), if given, their number without building them
+        self._ranked = iter(ranked)
+        self._hits = hits
+        self._counter = count
+        self._rows = []
+        self._count = None
+
+    def _fill(self, stop):
+        """Rank rows until stop of them are known, or all of them if stop is None."""
+        if stop is None:
+            self._rows.extend(self._ranked)
+        elif stop > len(self._rows):
+            self._rows.extend(islice(self._ranked, stop - len(self._rows)))
+
+    def __len__(self):
+        if self._count is None:
+            if self._counter is not None:
+                self._count = self._counter()
+            else:
+                hits = self._hits()
+                self._count = len(hits) if isinstance(hits, (list, tuple)) else sum(1 for _ in hits)
+        return self._count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            stop = item.stop if item.stop is not None and item.stop >= 0 and (item.start or 0) >= 0 else None
+        else:
+            stop = item + 1 if item >= 0 else None
+        self._fill(stop)
+        return self._rows[item]
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if i >= len(self._rows):
+                self._fill(i + RANK_CHUNK)
+                if i >= len(self._rows):
+                    return
+            yield self._rows[i]
+            i += 1
+
+    def where(self, mask):
+        """Return the matches whose row is set in a per-row 0/1 mask, in the same order."""
+        return Matches(filter(mask.__getitem__, self), lambda: filter(mask.__getitem__, self._hits()))
+
+
+class NameIndex:
+    """Substring and prefix index over a list of names.
+
+    Rows are referred to by their position in the list. Every posting list
+    is kept in base rank order (shorter names first, then alphabetical), so
+    matches are read off them lazily, best first, instead of being sorted.
+    Renamed and appended rows are indexed in place by update().
+    """
+
+    def __init__(self, names):
+        lowered = [n.lower() for n in names]
+        order = sorted(range(len(lowered)), key=lambda row: (len(lowered[row]), lowered[row], row))
+        # Lower-case again in rank order, so names read along a posting list sit close together in memory
+        self.names = [None] * len(lowered)
+        for row in order:
+            self.names[row] = names[row].lower()
+        del lowered
+        self.exact = {}
+        self.name_prefixes = {}
+        self.word_prefixes = {}
+        # Rows containing each 1- to 3-character substring
+        self.grams = {}
+        for row in order:
+            for postings, key in self._postings(row):
+                postings.setdefault(key, []).append(row)
+
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.names)
+
+    def rank(self, row):
+        """Return the base rank sort key of a row."""
+        name = self.names[row]
+        return (len(name), name, row)
+
+    def _postings(self, row):
+        """Yield (table, key) for every ordered posting list a row belongs to."""
+        name = self.names[row]
+        yield self.exact, name
+        for size in (1, 2):
+            if len(name) >= size:
+                yield self.name_prefixes, name[:size]
+        for prefix in {w[:size] for w in _WORD_SPLIT.split(name) for size in (1, 2) if len(w) >= size}:
+            yield self.word_prefixes, prefix
+        for gram in _grams(name):
+            yield self.grams, gram
+
+    def update(self, rows, names):
+        """Reindex rows whose name changed or that were appended, taking names from the full name list."""
+        for row in sorted(rows):
+            name = names[row].lower()
+            if row < len(self.names):
+                if self.names[row] == name:
+                    continue
+                self._discard(row)
+                self.names[row] = name
+            else:
+                # Rows are only ever appended at the end
+                self.names.append(name)
+            self._add(row)
+        self._cache.clear()
+
+    def _add(self, row):
+        for postings, key in self._postings(row):
+            insort(postings.setdefault(key, []), row, key=self.rank)
+
+    def _discard(self, row):
+        for postings, key in self._postings(row):
+            rows = postings[key]
+            rows.remove(row)
+            if not rows:
+                del postings[key]
+
+    def search(self, query):
+        """Return the matching rows as Matches, best match first.
+
+        Exact matches rank first, then name prefixes, word prefixes and
+        substrings; if nothing contains the query, names sharing most of its
+        trigrams are returned as typo-tolerant matches.
+        """
+        query = query.strip().lower()
+        if not query:
+            return Matches((), tuple)
+        cached = self._cache.get(query)
+        if cached is not None:
+            self._cache.move_to_end(query)
+            return cached
+
+        result = self._search(query)
+
+        self._cache[query] = result
+        if len(self._cache) > MAX_CACHED_QUERIES:
+            self._cache.popitem(last=False)
+        return result
+
+    def _search(self, query):
+        """Rank the rows containing the query by tier, reading each tier lazily off its posting list."""
+        if len(query) <= 3:
+            contained = self.grams.get(query, [])
+
+            def hits():
+                return contained
+        else:
+            grams = _trigrams(query)
+            postings = [self.grams.get(g) for g in grams]
+            # Every row containing the query is in the rarest trigram's rows; the substring check does the rest
+            rarest = min(postings, key=lambda rows: len(rows or ()))
+
+            def hits():
+                return self._containing(query, rarest or ())
+
+            def count():
+                return sum(map(contains, map(self.names.__getitem__, rarest), repeat(query)))
+
+            if not any(True for _ in hits()):
+                fuzzy = self._search_fuzzy(grams)
+                return Matches(fuzzy, lambda: fuzzy)
+            contained = hits()
+
+        names = self.names
+        size = len(query)
+        word = _WORD_PREFIX.match(query)
+        word_start = re.compile(r"(?:^|[^0-9a-z])" + re.escape(query)).search if word else None
+        name_prefixed = self.name_prefixes.get(query[:2], [])
+        if size > 2:
+            name_prefixed = compress(name_prefixed, map(str.startswith, map(names.__getitem__, name_prefixed), repeat(query)))
+        word_prefixed = self._containing(query, self.word_prefixes.get(word.group(), [])) if word else ()
+
+        def inside_word(row):
+            name = names[row]
+            return not name.startswith(query) and not (word_start and word_start(name))
+
+        ranked = chain(
+            self.exact.get(query, ()),
+            (row for row in name_prefixed if len(names[row]) != size),
+            (row for row in word_prefixed if not names[row].startswith(query) and word_start(names[row])),
+            filter(inside_word, contained),
+        )
+        return Matches(ranked, hits, count if size > 3 else None)
+
+    def _containing(self, query, rows):
+        """Return the rows containing the query, in the order given."""
+        return compress(rows, map(contains, map(self.names.__getitem__, rows), repeat(query)))
+
+    def _search_fuzzy(self, grams):
+        """Rank rows by the number of query trigrams they share."""
+        counts = Counter()
+        for g in grams:
+            counts.update(self.grams.get(g, ()))
+        needed = max(1, int(len(grams) * MIN_FUZZY_SIMILARITY + 0.5))
+        hits = [row for row, n in counts.items() if n >= needed]
+        return sorted(hits, key=lambda row: (-counts[row], self.rank(row)))
+
+
+def scan(names, query):
+    """Return the rows whose name contains the query, in list order, for use while no index is built."""
+    query = query.strip().lower()
+
+    def hits():
+        return (row for row, name in enumerate(names) if query in name.lower())
+
+    return Matches(hits(), hits)
+
+
+def get_index():
+    """Return the installed name index, or None while none is built."""
+    return _index
+
+
+def set_index(index):
+    """Install a name index built for the current asset names."""
+    global _index
+    _index = index
+
+
+def update_index(names, rows):
+    """Reindex renamed or appended rows of the name index, if one is installed."""
+    if _index is not None:
+        _index.update(rows, names)
+
+
+def invalidate_index():
+    """Drop the name index; searches scan the names until a new one is installed."""
+    global _index
+    _index = None
@@ -0,0 +1,136 @@
+"""Selector lists served stale-while-revalidate, and warm-up of what the user may switch to next.
+
+Account, studio and project lists are kept in memory and in the disk cache.
+A selector shows its cached list at once, or as soon as it is read from disk
+in the background; a list older than SELECTOR_TTL is refetched in the
+background and the selector updated when it arrives. The main thread never
+touches the disk.
+
+Once the session is known, the project lists of the account's other studios
+and the asset lists of recently used projects are fetched in the background,
+so switching to them shows data without waiting for the bridge.
+"""
+
+import time
+
+from . import api_client, cache, helpers, jobs
+
+SELECTOR_TTL = 60.0
+# Minimum time between background refreshes of a recent project's assets
+ASSET_WARM_TTL = 300.0
+RECENT_PROJECTS = 3
+
+_lists = {}
+_fetched_at = {}
+# Keys whose disk entry has been read, or is being read
+_disk_read = set()
+_warmed = {}
+# Warm-ups the bridge has no endpoint for
+_unsupported = set()
+
+
+def get(key, fetch, *args, on_update=None, on_error=None, is_current=None):
+    """Return the cached list for key, or None, refetching it in the background when stale.
+
+    fetch(*args) runs on a worker and returns (data, error); a fresh list is
+    stored and passed to on_update on the main thread, or the error to
+    on_error. Lists of the bridge's active account or studio pass is_current,
+    which tells whether key still names them: a result arriving after a
+    switch is dropped rather than stored under the wrong key. A list not in
+    memory yet is read from disk on a worker and passed to on_update too,
+    unless a fresh one arrived first.
+    """
+    data = _lists.get(key)
+    if data is None and key not in _disk_read:
+        _disk_read.add(key)
+
+        def loaded(cached):
+            if cached is None or key in _lists or (is_current is not None and not is_current()):
+                return
+            _lists[key] = cached
+            if on_update is not None:
+                on_update(cached)
+
+        jobs.submit(("selector-disk",) + key, cache.load, "selector", *key, on_done=loaded)
+
+    if time.monotonic() - _fetched_at.get(key, float("-inf")) > SELECTOR_TTL:
+        def finished(result):
+            fresh, err = result
+            if is_current is not None and not is_current():
+                return
+            if err:
+                if on_error is not None:
+                    on_error(err)
+                return
+            put(key, fresh)
+            if on_update is not None:
+                on_update(fresh)
+
+        jobs.submit(("selector",) + key, fetch, *args, on_done=finished)
+    return data
+
+
+def put(key, data):
+    """Store a list fetched from the bridge."""
+    _lists[key] = data
+    _fetched_at[key] = time.monotonic()
+    _disk_read.add(key)
+    cache.store_later("selector", *key, data=data)
+
+
+def _note_recent(key, project_id):
+    """Cache writer: put a project first in its studio's recent projects."""
+    recent = [p for p in cache.load("recent-projects", *key) or [] if p != project_id]
+    cache.store("recent-projects", *key, data=[project_id] + recent[:RECENT_PROJECTS - 1])
+
+
+def note_project(clustta):
+    """Remember the active project as the most recently used in its studio."""
+    project_id = clustta.active_project_id
+    if not project_id:
+        return
+    cache.defer(_note_recent, (clustta.active_account_id, clustta.active_studio_id), project_id)
+    # Its assets are being loaded anyway
+    _warmed[project_id] = time.monotonic()
+
+
+def _fetch_studio_projects(studio):
+    """Worker: fetch the project list of a studio other than the active one."""
+    projects, err = api_client.get_client().list_projects(studio)
+    if err and err.startswith("HTTP 404"):
+        _unsupported.add("studio-projects")
+    return projects, err
+
+
+def _warm_assets(scope):
+    """Worker: cache the asset list of a project other than the active one."""
+    err = helpers.warm_asset_cache(scope)
+    if err and err.startswith("HTTP 404"):
+        _unsupported.add("project-assets")
+
+
+def warm_up(clustta):
+    """Prefetch the other studios' project lists and the recent projects' assets in the background."""
+    from . import operators
+    account_id = clustta.active_account_id
+    studio_id = clustta.active_studio_id
+    if not account_id or not api_client.get_client().is_available():
+        return
+
+    if "studio-projects" not in _unsupported:
+        for studio, _, _ in operators.selector_items()["studios"]:
+            if studio not in ("__NONE__", studio_id):
+                get(("projects", account_id, studio), _fetch_studio_projects, studio)
+
+    if "project-assets" not in _unsupported and studio_id:
+        active_project_id = clustta.active_project_id
+
+        def warm_recent(recent):
+            now = time.monotonic()
+            for project_id in recent or []:
+                if project_id == active_project_id or now - _warmed.get(project_id, float("-inf")) < ASSET_WARM_TTL:
+                    continue
+                if jobs.submit(("warm-assets", project_id), _warm_assets, (account_id, studio_id, project_id)):
+                    _warmed[project_id] = now
+
+        jobs.submit(("recent-projects", account_id, studio_id), cache.load, "recent-projects", account_id, studio_id, on_done=warm_recent)
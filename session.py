@@ -0,0 +1,134 @@
+"""Session snapshot: shows the last known Clustta state as soon as a .blend file is opened.
+
+The active account, studio and project, with the selector lists, are saved
+to the disk cache whenever they change. On startup and after every file
+load they are read back on a worker and restored as soon as they arrive,
+the project's cached asset list is shown, and everything is revalidated
+against the bridge in the background. The session counts as connected once
+that revalidation succeeds.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from . import api_client, cache, connection, helpers, jobs
+
+SESSION_FIELDS = (
+    "active_account",
+    "active_account_id",
+    "active_studio",
+    "active_studio_id",
+    "active_project",
+    "active_project_id",
+)
+
+
+def save(clustta):
+    """Snapshot the active selections and selector lists."""
+    from . import operators
+    data = {field: getattr(clustta, field) for field in SESSION_FIELDS}
+    data["selectors"] = operators.selector_items()
+    cache.store_later("session", data=data)
+
+
+def restore():
+    """Read the last snapshot in the background; it is shown once read, then revalidated."""
+    jobs.submit(("session-restore",), cache.load, "session", on_done=_on_restored)
+
+
+def _on_restored(data):
+    """Main thread: show a read snapshot at once, then revalidate it in the background."""
+    from . import operators
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None or not isinstance(data, dict) or not data.get("active_account_id"):
+        return
+    clustta = scene.clustta
+
+    for field in SESSION_FIELDS:
+        setattr(clustta, field, data.get(field, ""))
+    operators.restore_selector_items(data.get("selectors") or {})
+
+    helpers.reset_asset_cache()
+    helpers.reset_checkpoint_cache()
+    if clustta.active_project_id:
+        helpers.request_assets(clustta)
+        asset_id = helpers.selected_asset_id(clustta)
+        if asset_id:
+            helpers.request_checkpoints(clustta, asset_id)
+
+    revalidate()
+
+
+def revalidate():
+    """Fetch the active selections and selector lists from the bridge in the background and merge them."""
+    from . import operators
+    client = api_client.get_client()
+    epoch = client.epoch
+    jobs.submit(
+        ("session", epoch), operators.fetch_session_state, client,
+        on_done=lambda state: _on_revalidated(state, client, epoch),
+    )
+
+
+def _on_revalidated(state, client, epoch):
+    """Main thread: mark the session connected and merge the bridge's session state, reloading assets if the project changed.
+
+    State fetched before a switch is dropped and fetched again, so it cannot
+    put back the selections the switch replaced.
+    """
+    from . import operators
+    if api_client.get_client() is not client or client.epoch != epoch:
+        revalidate()
+        return
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return
+    clustta = scene.clustta
+
+    _, err = state["active_project"]
+    if err == api_client.BRIDGE_UNREACHABLE:
+        clustta.bridge_connected = False
+        return
+    if any(e not in (api_client.BRIDGE_UNREACHABLE, api_client.BRIDGE_TIMEOUT) for _, e in state.values()):
+        # The bridge answered
+        clustta.bridge_connected = True
+        # A restored session was connected before, so it reconnects like one made with the Connect button
+        connection.mark_connected()
+
+    project_id = clustta.active_project_id
+    operators.apply_session_state(clustta, state)
+    if clustta.active_project_id != project_id:
+        helpers.clear_assets(clustta)
+        clustta.checkpoints.clear()
+        helpers.reset_asset_cache()
+        helpers.reset_checkpoint_cache()
+        if clustta.active_project_id:
+            helpers.request_assets(clustta)
+
+
+@persistent
+def _on_load_post(*args):
+    if bpy.app.timers.is_registered(_restore_on_startup):
+        bpy.app.timers.unregister(_restore_on_startup)
+    if getattr(bpy.context, "scene", None) is not None:
+        restore()
+
+
+def _restore_on_startup():
+    """Timer callback: restore once the startup file's scene is available."""
+    _on_load_post()
+    return None
+
+
+def register():
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    # Scene data cannot be written while the addon registers
+    bpy.app.timers.register(_restore_on_startup, first_interval=0.1)
+
+
+def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if bpy.app.timers.is_registered(_restore_on_startup):
+        bpy.app.timers.unregister(_restore_on_startup)
@@ -0,0 +1,186 @@
+"""Compact, column-oriented store of the loaded assets.
+
+The store, not the UI, is the source of truth for the asset list: every
+asset is a row across a few flat columns. Free-text fields are plain string
+lists; low-cardinality fields (task type, status, file state) are interned
+and kept as 2-byte codes in arrays, so 100k assets cost a few megabytes and
+no Blender data. The UI list only ever holds the visible window of rows.
+"""
+
+from array import array
+from itertools import compress
+
+# Bridge asset fields kept as plain strings, and as interned codes
+TEXT_COLUMNS = ("name", "file_path")
+CODED_COLUMNS = ("task_type_name", "status_short_name", "file_status")
+
+
+class _CodedColumn:
+    """A column of interned strings stored as array codes, with the number of rows per code."""
+
+    def __init__(self):
+        self.values = [""]
+        self.codes_by_value = {"": 0}
+        self.codes = array("H")
+        self.counts = [0]
+
+    def code(self, value):
+        """Return the code of a value, interning it on first use."""
+        code = self.codes_by_value.get(value)
+        if code is None:
+            code = self.codes_by_value[value] = len(self.values)
+            self.values.append(value)
+            self.counts.append(0)
+        return code
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def __setitem__(self, row, value):
+        code = self.code(value)
+        self.counts[self.codes[row]] -= 1
+        self.counts[code] += 1
+        self.codes[row] = code
+
+    def append(self, value):
+        code = self.code(value)
+        self.counts[code] += 1
+        self.codes.append(code)
+
+    def take(self, rows):
+        self.codes = array("H", [self.codes[r] for r in rows])
+        self.counts = [0] * len(self.values)
+        for code in self.codes:
+            self.counts[code] += 1
+
+    def present(self):
+        """Return the values that occur in at least one row, without scanning the rows."""
+        return [value for value, count in zip(self.values, self.counts) if count]
+
+    def mask(self, value):
+        """Return the rows holding a value as an int packing one 0/1 byte per row, so masks can be AND-ed."""
+        code = self.codes_by_value.get(value)
+        if code is None:
+            return 0
+        return int.from_bytes(bytes(map(code.__eq__, self.codes)), "little")
+
+
+class AssetStore:
+    """Column-oriented asset rows keyed by asset id, in bridge order.
+
+    version changes on every modification, so derived data (filter masks,
+    search index, UI window) can tell when it is stale.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.ids = []
+        self.columns = {key: [] for key in TEXT_COLUMNS}
+        self.columns.update({key: _CodedColumn() for key in CODED_COLUMNS})
+        self._rows = {}
+        self._masks = None
+        self.version += 1
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row_of(self, asset_id):
+        """Return the row of an asset, or None."""
+        return self._rows.get(asset_id)
+
+    def get(self, row, key):
+        """Return a bridge field of a row."""
+        return self.columns[key][row]
+
+    def names(self):
+        """Return the name column, indexed by row."""
+        return self.columns["name"]
+
+    def upsert(self, a):
+        """Add or update a bridge asset dict; new assets are appended. Returns True if anything changed."""
+        asset_id = a.get("id", "")
+        row = self._rows.get(asset_id)
+        if row is None:
+            self._rows[asset_id] = len(self.ids)
+            self.ids.append(asset_id)
+            for key, column in self.columns.items():
+                column.append(a.get(key, ""))
+            self._touch()
+            return True
+
+        changed = False
+        for key, column in self.columns.items():
+            value = a.get(key, "")
+            if column[row] != value:
+                column[row] = value
+                changed = True
+        if changed:
+            self._touch()
+        return changed
+
+    def set(self, asset_id, key, value):
+        """Set one field of an asset. Returns True if it changed."""
+        row = self._rows.get(asset_id)
+        if row is None or self.columns[key][row] == value:
+            return False
+        self.columns[key][row] = value
+        self._touch()
+        return True
+
+    def retain(self, asset_ids):
+        """Keep only the given assets, in the given order. Returns the number of rows removed."""
+        rows = [self._rows[asset_id] for asset_id in asset_ids if asset_id in self._rows]
+        removed = len(self.ids) - len(rows)
+        if rows == list(range(len(self.ids))):
+            return 0
+        self._take(rows)
+        return removed
+
+    def remove(self, asset_ids):
+        """Remove assets by id. Returns the number of rows removed."""
+        doomed = {self._rows[a] for a in asset_ids if a in self._rows}
+        if not doomed:
+            return 0
+        self._take([r for r in range(len(self.ids)) if r not in doomed])
+        return len(doomed)
+
+    def _take(self, rows):
+        """Rebuild every column from the given rows, in order."""
+        self.ids = [self.ids[r] for r in rows]
+        for key, column in self.columns.items():
+            if isinstance(column, _CodedColumn):
+                column.take(rows)
+            else:
+                self.columns[key] = [column[r] for r in rows]
+        self._rows = {asset_id: row for row, asset_id in enumerate(self.ids)}
+        self._touch()
+
+    def _touch(self):
+        self.version += 1
+        self._masks = None
+
+    def present(self, key):
+        """Return the distinct values of a coded field that occur in the store."""
+        return self.columns[key].present()
+
+    def mask(self, filters):
+        """Return the rows matching every (key, value) filter as a bytes mask of 0/1 per row."""
+        if self._masks is None:
+            self._masks = {}
+        count = len(self.ids)
+        combined = int.from_bytes(b"\x01" * count, "little")
+        for key, value in filters:
+            mask = self._masks.get((key, value))
+            if mask is None:
+                mask = self._masks[(key, value)] = self.columns[key].mask(value)
+            combined &= mask
+        return combined.to_bytes(count, "little")
+
+    def rows_where(self, filters):
+        """Return the rows matching every (key, value) filter, in store order."""
+        if not filters:
+            return range(len(self.ids))
+        return list(compress(range(len(self.ids)), self.mask(filters)))
@@ -0,0 +1,305 @@
+"""Asset thumbnails for the task list, produced in the background and cached on disk.
+
+A thumbnail is extracted from the preview embedded in the asset's local
+.blend file, or fetched from the bridge when there is no local file. Worker
+threads write them to the disk cache as PNG; the UI only ever loads cached
+files into a bpy.utils.previews collection, which holds at most
+MAX_PREVIEWS images and drops the least recently drawn ones. Drawing never
+waits for disk or network: rows without a thumbnail yet show a placeholder
+and are redrawn when it arrives.
+"""
+
+import gzip
+import hashlib
+import os
+import queue
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+
+import bpy
+import bpy.utils.previews
+
+from . import api_client, cache, jobs
+
+try:
+    import zstandard
+except ImportError:
+    # Without it, previews of zstd-compressed files come from the bridge instead
+    zstandard = None
+
+MAX_PREVIEWS = 256
+THUMBNAIL_WORKERS = 2
+THUMBNAIL_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DELIVER_INTERVAL = 0.1
+# .blend blocks read while looking for the thumbnail, which is stored near the start
+MAX_BLEND_BLOCKS = 16
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_previews = None
+_lru = OrderedDict()
+_on_disk = set()
+_missing = set()
+_requested = set()
+# Cached file name -> asset id, for files the workers report as evicted
+_file_ids = {}
+_requests = queue.LifoQueue()
+_ready = queue.Queue()
+_evicted = queue.Queue()
+_workers = []
+_lock = threading.Lock()
+
+
+def thumbnail_dir():
+    """Return the directory holding cached thumbnails. Workers create it when writing the first one."""
+    return os.path.join(cache.cache_dir(), "thumbnails")
+
+
+def _file_name(asset_id):
+    return hashlib.sha1(asset_id.encode("utf-8")).hexdigest() + ".png"
+
+
+def _thumbnail_path(asset_id):
+    return os.path.join(thumbnail_dir(), _file_name(asset_id))
+
+
+def _png(width, height, rgba):
+    """Encode bottom-up RGBA rows, as stored in .blend files, as a PNG."""
+    stride = width * 4
+    rows = b"".join(b"\x00" + rgba[y * stride:(y + 1) * stride] for y in range(height - 1, -1, -1))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+def extract_blend_thumbnail(path):
+    """Return the preview embedded in a .blend file as PNG bytes, or None.
+
+    Reads the file header and the first few blocks only. Uncompressed,
+    gzip-compressed (before Blender 3.0) and, when the zstandard module is
+    available, zstd-compressed files with the classic header are supported.
+    """
+    try:
+        with open(path, "rb") as f:
+            magic = f.read(4)
+            f.seek(0)
+            if magic[:2] == b"\x1f\x8b":
+                opener = gzip.open(path, "rb")
+            elif magic == ZSTD_MAGIC:
+                if zstandard is None:
+                    return None
+                opener = zstandard.ZstdDecompressor().stream_reader(f, closefd=False)
+            else:
+                opener = None
+            stream = opener or f
+            try:
+                header = stream.read(12)
+                if len(header) < 12 or header[:7] != b"BLENDER" or header[7:8] not in (b"_", b"-"):
+                    return None
+                pointer_size = 8 if header[7:8] == b"-" else 4
+                endian = "<" if header[8:9] == b"v" else ">"
+                block_header = struct.Struct(f"{endian}4si{'Q' if pointer_size == 8 else 'I'}ii")
+                for _ in range(MAX_BLEND_BLOCKS):
+                    raw = stream.read(block_header.size)
+                    if len(raw) < block_header.size:
+                        return None
+                    code, size, _, _, _ = block_header.unpack(raw)
+                    if code == b"TEST":
+                        data = stream.read(size)
+                        width, height = struct.unpack(f"{endian}ii", data[:8])
+                        if width <= 0 or height <= 0 or len(data) < 8 + width * height * 4:
+                            return None
+                        return _png(width, height, data[8:8 + width * height * 4])
+                    if code == b"ENDB":
+                        return None
+                    stream.seek(size, os.SEEK_CUR)
+            finally:
+                if opener is not None:
+                    opener.close()
+    except (OSError, EOFError, struct.error, ValueError):
+        # ValueError: e.g. a corrupt zstd frame
+        return None
+    return None
+
+
+def _produce(project_id, asset_id, file_path):
+    """Worker: make sure a cached thumbnail exists for an asset. Returns True if one does."""
+    dest = _thumbnail_path(asset_id)
+    try:
+        cached_mtime = os.stat(dest).st_mtime_ns
+    except OSError:
+        cached_mtime = None
+    try:
+        blend_mtime = os.stat(file_path).st_mtime_ns if file_path else None
+    except OSError:
+        blend_mtime = None
+    if cached_mtime is not None and (blend_mtime is None or cached_mtime >= blend_mtime):
+        return True
+
+    data = extract_blend_thumbnail(file_path) if blend_mtime is not None else None
+    if data is None and cached_mtime is None:
+        data, err = api_client.get_client().get_thumbnail(project_id, asset_id)
+        if err:
+            data = None
+    if data is None:
+        return cached_mtime is not None
+
+    tmp_path = f"{dest}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, dest)
+    except OSError:
+        return cached_mtime is not None
+    evicted = _evict(THUMBNAIL_CACHE_MAX_BYTES)
+    if evicted:
+        _evicted.put(evicted)
+    return True
+
+
+def _work():
+    """Worker thread: produce the most recently requested thumbnails first."""
+    while True:
+        request = _requests.get()
+        if request is None:
+            return
+        try:
+            ok = _produce(*request)
+        except Exception:
+            ok = False
+        _ready.put((request[1], ok))
+
+
+def _evict(max_bytes):
+    """Delete least recently written thumbnails until the cache fits in max_bytes. Returns the deleted file names."""
+    evicted = []
+    with _lock:
+        entries = []
+        total = 0
+        try:
+            with os.scandir(thumbnail_dir()) as it:
+                for entry in it:
+                    if entry.name.endswith(".png"):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total += st.st_size
+        except OSError:
+            return evicted
+        if total <= max_bytes:
+            return evicted
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            evicted.append(os.path.basename(path))
+            total -= size
+            if total <= max_bytes:
+                break
+    return evicted
+
+
+def _deliver():
+    """Timer callback: note produced and evicted thumbnails and redraw so their rows pick them up."""
+    delivered = False
+    while True:
+        try:
+            names = _evicted.get_nowait()
+        except queue.Empty:
+            break
+        # Evicted thumbnails are produced again when their rows are next drawn
+        _forget([_file_ids[name] for name in names if name in _file_ids])
+        delivered = True
+    while True:
+        try:
+            asset_id, ok = _ready.get_nowait()
+        except queue.Empty:
+            break
+        _requested.discard(asset_id)
+        (_on_disk if ok else _missing).add(asset_id)
+        delivered = True
+    if delivered:
+        jobs.tag_redraw()
+    return DELIVER_INTERVAL if _requested else None
+
+
+def _request(project_id, asset_id, file_path):
+    if not _workers:
+        for i in range(THUMBNAIL_WORKERS):
+            thread = threading.Thread(target=_work, name=f"clustta-thumbnail-{i}", daemon=True)
+            thread.start()
+            _workers.append(thread)
+    _requested.add(asset_id)
+    _file_ids[_file_name(asset_id)] = asset_id
+    _requests.put((project_id, asset_id, file_path))
+    if not bpy.app.timers.is_registered(_deliver):
+        bpy.app.timers.register(_deliver, first_interval=DELIVER_INTERVAL)
+
+
+def icon_id(clustta, item):
+    """Return the preview icon of a list item's asset, or 0 while it has none. Never blocks on I/O.
+
+    A missing thumbnail is requested in the background; cached ones are
+    loaded into the preview collection, evicting the least recently drawn.
+    """
+    global _previews
+    asset_id = item.asset_id
+    preview = _lru.get(asset_id)
+    if preview is not None:
+        _lru.move_to_end(asset_id)
+        return preview.icon_id
+    if asset_id in _missing or asset_id in _requested:
+        return 0
+    if asset_id not in _on_disk:
+        _request(clustta.active_project_id, asset_id, bpy.path.abspath(item.file_path))
+        return 0
+
+    if _previews is None:
+        _previews = bpy.utils.previews.new()
+    # Image previews are read lazily by Blender, so loading does not touch the disk here
+    preview = _previews.load(asset_id, _thumbnail_path(asset_id), "IMAGE", force_reload=True)
+    _lru[asset_id] = preview
+    while len(_lru) > MAX_PREVIEWS:
+        old_id, _ = _lru.popitem(last=False)
+        del _previews[old_id]
+    return preview.icon_id
+
+
+def _forget(asset_ids):
+    for asset_id in asset_ids:
+        _on_disk.discard(asset_id)
+        _missing.discard(asset_id)
+        if _lru.pop(asset_id, None) is not None:
+            del _previews[asset_id]
+
+
+def invalidate(asset_ids):
+    """Forget the thumbnails of assets whose file changed, so they are produced again when drawn."""
+    _forget(asset_ids)
+
+
+def forget_missing():
+    """Let assets without a thumbnail be tried again, e.g. after a reload or once the bridge is back."""
+    _missing.clear()
+
+
+def unregister():
+    global _previews
+    for _ in _workers:
+        _requests.put(None)
+    _workers.clear()
+    if bpy.app.timers.is_registered(_deliver):
+        bpy.app.timers.unregister(_deliver)
+    _requested.clear()
+    _file_ids.clear()
+    _lru.clear()
+    if _previews is not None:
+        bpy.utils.previews.remove(_previews)
+        _previews = None